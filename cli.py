@@ -14,10 +14,11 @@ import click
 from core.file_filter import FileFilter
 from core.generator import UMLGenerator
 from core.analyzer import FileAnalyzer
+from utils.atomic_output import AtomicOutputFile
 from utils.error_handling import (
     handle_cli_error, print_warnings, validate_file_path,
     validate_directory_path, validate_output_path, validate_format,
-    FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError
+    FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError
 )
 
 @click.group(context_settings=dict(help_option_names=['-h', '--help']))
@@ -29,6 +30,8 @@ def cli():
     Examples:
       py2puml generate src/ output/diagram.puml
       py2puml generate src/ output/diagram.puml --no-gitignore
+      py2puml generate src/ output/diagram.puml --cache-dir _ast_cache
+      py2puml generate src/ output/diagram.puml --jobs 0
       py2puml describe src/models.py
       py2puml describe src/models.py --format json
       py2puml describe src/models.py --format yaml --no-docs
@@ -40,7 +43,9 @@ def cli():
 @click.argument('output_file', type=click.Path())
 @click.option('--no-gitignore', is_flag=True, default=False, help='Do not use .gitignore patterns')
 @click.option('--use-gitignore', is_flag=True, default=False, help='Use .gitignore patterns (default)')
-def generate(directory, output_file, no_gitignore, use_gitignore):
+@click.option('--cache-dir', type=click.Path(file_okay=False), default=None, help='Directory for the persistent AST cache (e.g. _ast_cache); entries are unpickled, so use only a trusted directory')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=1, help='Number of parallel parser processes (0 uses all CPU cores)')
+def generate(directory, output_file, no_gitignore, use_gitignore, cache_dir, jobs):
     """Generate UML diagram from Python source files"""
     try:
         # Validate inputs
@@ -58,27 +63,28 @@ def generate(directory, output_file, no_gitignore, use_gitignore):
         file_filter = FileFilter(str(directory_path), use_gitignore=use_gitignore_flag)
 
         # Create UML generator
-        generator = UMLGenerator(str(directory_path), file_filter)
+        generator = UMLGenerator(str(directory_path), file_filter, cache_dir=cache_dir, jobs=jobs)
 
-        # Generate UML
-        uml_output = generator.generate_uml()
-
-        # Write output to file
+        # Stream the diagram into a temporary file that replaces the output only on success
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(uml_output)
+            output = AtomicOutputFile(output_path)
         except PermissionError:
-            raise PermissionError(f"Permission denied writing to {output_path}")
+            raise PermissionCLIError(f"Permission denied writing to {output_path}")
         except Exception as e:
             raise Exception(f"Failed to write output file {output_path}: {e}")
 
+        # Generate UML
+        with output as file:
+            generator.generate_uml(out=file)
+
         click.echo(f"PlantUML code has been saved to {output_path}")
+        if cache_dir:
+            click.echo(f"AST cache: {generator.cache_hits} hits, {generator.cache_misses} misses")
 
         # Print warnings if any
-        all_warnings = generator.errors + generator.parser.errors
-        print_warnings(all_warnings)
+        print_warnings(generator.errors)
 
-    except (FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError) as e:
+    except (FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError) as e:
         handle_cli_error(e)
     except Exception as e:
         handle_cli_error(e)
@@ -107,7 +113,7 @@ def describe(file, format_, no_docs):
         # Print warnings if any
         print_warnings(analyzer.parser.errors)
 
-    except (FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError) as e:
+    except (FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError) as e:
         handle_cli_error(e)
     except Exception as e:
         handle_cli_error(e)
@@ -13,13 +13,36 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from py2puml.core.file_filter import FileFilter
 from py2puml.core.generator import UMLGenerator
 from py2puml.core.analyzer import FileAnalyzer
+from py2puml.utils.atomic_output import AtomicOutputFile
 from py2puml.utils.error_handling import (
     handle_cli_error, print_warnings, validate_file_path, 
     validate_directory_path, validate_output_path, validate_format,
-    FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError
+    FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError
 )
 
 
+def non_negative_int(value: str) -> int:
+    """
+    Parse a command-line integer that must not be negative.
+    
+    Args:
+        value: Raw argument value
+        
+    Returns:
+        Parsed integer
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer >= 0
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{number} is not in the range x>=0")
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """
     Create command-line argument parser.
@@ -34,6 +57,8 @@ def create_parser() -> argparse.ArgumentParser:
 Examples:
   python cli_direct.py generate src/ output/diagram.puml
   python cli_direct.py generate src/ output/diagram.puml --no-gitignore
+  python cli_direct.py generate src/ output/diagram.puml --cache-dir _ast_cache
+  python cli_direct.py generate src/ output/diagram.puml --jobs 0
   python cli_direct.py describe src/models.py
   python cli_direct.py describe src/models.py --format json
   python cli_direct.py describe src/models.py --format yaml --no-docs
@@ -65,6 +90,17 @@ Examples:
         action='store_true',
         help='Use .gitignore patterns (default)'
     )
+    generate_parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the persistent AST cache (e.g. _ast_cache); entries are unpickled, so use only a trusted directory'
+    )
+    generate_parser.add_argument(
+        '--jobs', '-j',
+        type=non_negative_int,
+        default=1,
+        help='Number of parallel parser processes (0 uses all CPU cores)'
+    )
     
     # Describe command
     describe_parser = subparsers.add_parser(
@@ -116,29 +152,30 @@ def handle_generate_command(args: argparse.Namespace) -> int:
         file_filter = FileFilter(str(directory_path), use_gitignore=use_gitignore)
         
         # Create UML generator
-        generator = UMLGenerator(str(directory_path), file_filter)
+        generator = UMLGenerator(str(directory_path), file_filter, cache_dir=args.cache_dir, jobs=args.jobs)
         
-        # Generate UML
-        uml_output = generator.generate_uml()
-        
-        # Write output to file
+        # Stream the diagram into a temporary file that replaces the output only on success
         try:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(uml_output)
+            output = AtomicOutputFile(output_path)
         except PermissionError as e:
-            raise PermissionError(f"Permission denied writing to {output_path}")
+            raise PermissionCLIError(f"Permission denied writing to {output_path}")
         except Exception as e:
             raise Exception(f"Failed to write output file {output_path}: {e}")
         
+        # Generate UML
+        with output as file:
+            generator.generate_uml(out=file)
+        
         print(f"PlantUML code has been saved to {output_path}")
+        if args.cache_dir:
+            print(f"AST cache: {generator.cache_hits} hits, {generator.cache_misses} misses")
         
         # Print warnings if any
-        all_warnings = generator.errors + generator.parser.errors
-        print_warnings(all_warnings)
+        print_warnings(generator.errors)
         
         return 0
         
-    except (FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError) as e:
+    except (FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError) as e:
         handle_cli_error(e)
     except Exception as e:
         handle_cli_error(e)
@@ -174,7 +211,7 @@ def handle_describe_command(args: argparse.Namespace) -> int:
         
         return 0
         
-    except (FileNotFoundError, DirectoryNotFoundError, PermissionError, ValidationError) as e:
+    except (FileNotFoundCLIError, DirectoryNotFoundError, PermissionCLIError, ValidationError) as e:
         handle_cli_error(e)
     except Exception as e:
         handle_cli_error(e)
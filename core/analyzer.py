@@ -2,10 +2,19 @@ import ast
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from .parser import PythonParser
 
+# Use the libyaml-based dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# Visibility names by UML prefix; any other prefix is reported as protected
+_VISIBILITY_NAMES = {'+': 'public', '-': 'private', '#': 'protected'}
+
 
 class FileAnalyzer:
     """
@@ -20,7 +29,8 @@ class FileAnalyzer:
             directory_path: Path to the directory containing files to analyze
         """
         self.directory = Path(directory_path)
-        self.parser = PythonParser()
+        # Analyzers are long-lived in the MCP server, so unchanged files are not parsed again
+        self.parser = PythonParser(cache_results=True)
     
     def describe_file(self, file_path: Path, format: str = 'text', include_docs: bool = True) -> str:
         """
@@ -49,12 +59,17 @@ class FileAnalyzer:
             
             # Parse file
             parsed_data = self.parser.parse_file(file_path)
+            
+            # Read the source once; it feeds both the line count and a docstring index
+            # built in a single pass instead of searching the tree per member
+            content = self._read_source(file_path)
+            doc_index = self._build_doc_index(content) if include_docs else {}
             classes = parsed_data["classes"]
             functions = parsed_data["functions"]
             global_vars = parsed_data["global_vars"]
             
             # Get file statistics
-            summary = self._get_file_summary(file_path, classes, functions, global_vars)
+            summary = self._get_file_summary(file_path, classes, functions, global_vars, content=content)
             
             # Prepare data for formatting
             data = {
@@ -70,19 +85,7 @@ class FileAnalyzer:
                 class_name, fields, attributes, static_methods, methods, properties, class_type, bases = class_info
                 
                 # Extract class documentation
-                class_doc = None
-                if include_docs:
-                    # Find AST node of the class to extract documentation
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as file:
-                            content = file.read()
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                                class_doc = self._extract_documentation(node)
-                                break
-                    except Exception:
-                        pass
+                class_doc = doc_index.get((class_name, None))
                 
                 class_data = {
                     'name': class_name,
@@ -98,7 +101,7 @@ class FileAnalyzer:
                 for prefix, field in fields:
                     field_data = {
                         'name': field.split(':')[0].strip() if ':' in field else field,
-                        'visibility': 'public' if prefix.startswith('+') else 'private' if prefix.startswith('-') else 'protected',
+                        'visibility': _VISIBILITY_NAMES.get(prefix[:1], 'protected'),
                         'type': field.split(':')[1].strip() if ':' in field else None
                     }
                     class_data['fields'].append(field_data)
@@ -108,7 +111,7 @@ class FileAnalyzer:
                     property_name = property_info.split(':')[0].strip() if ':' in property_info else property_info.split(' ')[0]
                     property_data = {
                         'name': property_name,
-                        'visibility': 'public' if prefix.startswith('+') else 'private' if prefix.startswith('-') else 'protected',
+                        'visibility': _VISIBILITY_NAMES.get(prefix[:1], 'protected'),
                         'signature': property_info,
                         'access_level': self._extract_access_level(property_info)
                     }
@@ -119,30 +122,14 @@ class FileAnalyzer:
                     method_name = method.split('(')[0]
                     method_data = {
                         'name': method_name,
-                        'visibility': 'public' if prefix.startswith('+') else 'private' if prefix.startswith('-') else 'protected',
+                        'visibility': _VISIBILITY_NAMES.get(prefix[:1], 'protected'),
                         'signature': method,
                         'return_type': None,  # TODO: extract from annotations
                         'documentation': None
                     }
                     
                     # Extract method documentation
-                    if include_docs:
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as file:
-                                content = file.read()
-                            tree = ast.parse(content)
-                            for node in ast.walk(tree):
-                                if isinstance(node, ast.ClassDef) and node.name == class_name:
-                                    for body_item in node.body:
-                                        if isinstance(body_item, ast.FunctionDef) and body_item.name == method_name:
-                                            method_data['documentation'] = self._extract_documentation(body_item)
-                                            break
-                                        elif isinstance(body_item, ast.AsyncFunctionDef) and body_item.name == method_name:
-                                            method_data['documentation'] = self._extract_documentation(body_item)
-                                            break
-                                    break
-                        except Exception:
-                            pass
+                    method_data['documentation'] = doc_index.get((class_name, method_name))
                     
                     class_data['methods'].append(method_data)
                 
@@ -160,20 +147,7 @@ class FileAnalyzer:
                 }
                 
                 # Extract function documentation
-                if include_docs:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as file:
-                            content = file.read()
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.FunctionDef) and node.name == func_name:
-                                func_data['documentation'] = self._extract_documentation(node)
-                                break
-                            elif isinstance(node, ast.AsyncFunctionDef) and node.name == func_name:
-                                func_data['documentation'] = self._extract_documentation(node)
-                                break
-                    except Exception:
-                        pass
+                func_data['documentation'] = doc_index.get((None, func_name))
                 
                 data['functions'].append(func_data)
             
@@ -181,7 +155,7 @@ class FileAnalyzer:
             for prefix, var in global_vars:
                 var_data = {
                     'name': var,
-                    'visibility': 'public' if prefix.startswith('+') else 'private' if prefix.startswith('-') else 'protected',
+                    'visibility': _VISIBILITY_NAMES.get(prefix[:1], 'protected'),
                     'type': None,  # TODO: extract from annotations
                     'documentation': None
                 }
@@ -192,7 +166,53 @@ class FileAnalyzer:
         except Exception as e:
             return f"Error: {str(e)}"
     
-    def _get_file_summary(self, file_path: Path, classes: List, functions: List, variables: List) -> Dict[str, int]:
+    def _read_source(self, file_path: Path) -> Optional[str]:
+        """
+        Read a source file as text, returning None if it cannot be read or decoded.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                return file.read()
+        except Exception:
+            return None
+    
+    def _build_doc_index(self, content: Optional[str]) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        """
+        Parse source code once and collect the docstrings of its definitions.
+        
+        Only module-level statements and the direct body of each class are
+        visited; functions nested inside other definitions are not members.
+        
+        Args:
+            content: Source code, or None if the file could not be read
+            
+        Returns:
+            Dictionary keyed by (class name, None) for classes, (class name, method name)
+            for methods and (None, function name) for top-level functions; the first
+            definition wins for duplicate names, and it is empty if parsing fails
+        """
+        doc_index: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        if content is None:
+            return doc_index
+        try:
+            tree = ast.parse(content)
+        except Exception:
+            return doc_index
+        
+        function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                if (node.name, None) in doc_index:
+                    continue
+                doc_index[(node.name, None)] = self._extract_documentation(node)
+                for body_item in node.body:
+                    if isinstance(body_item, function_types):
+                        doc_index.setdefault((node.name, body_item.name), self._extract_documentation(body_item))
+            elif isinstance(node, function_types):
+                doc_index.setdefault((None, node.name), self._extract_documentation(node))
+        return doc_index
+    
+    def _get_file_summary(self, file_path: Path, classes: List, functions: List, variables: List, content: Optional[str] = None) -> Dict[str, int]:
         """
         Get file summary statistics.
         
@@ -201,14 +221,17 @@ class FileAnalyzer:
             classes: List of classes
             functions: List of functions
             variables: List of variables
+            content: Already read source code; the file is read when omitted
             
         Returns:
             Dictionary with summary statistics
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = len(file.readlines())
-        except Exception:
+        if content is None:
+            content = self._read_source(file_path)
+        if content:
+            # Same count as len(readlines()): a final line without a newline still counts
+            lines = content.count('\n') + (0 if content.endswith('\n') else 1)
+        else:
             lines = 0
         
         return {
@@ -275,7 +298,8 @@ class FileAnalyzer:
         # Header
         output.append(f"File: {data['file']}")
         summary = data['summary']
-        output.append(f"Summary: {summary['lines']} lines, {summary['classes']} classes, {summary['functions']} functions, {summary['variables']} variables")
+        lines, classes, functions, variables = summary['lines'], summary['classes'], summary['functions'], summary['variables']
+        output.append(f"Summary: {lines} lines, {classes} classes, {functions} functions, {variables} variables")
         output.append("")
         
         # Classes
@@ -351,7 +375,7 @@ class FileAnalyzer:
         Returns:
             YAML string
         """
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
     
     def _extract_access_level(self, property_info: str) -> str:
         """
@@ -0,0 +1,95 @@
+import ast
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class ASTCache:
+    """
+    Disk cache for parsed ASTs keyed by source hash and Python version.
+
+    Entries are unpickled on load, so the cache directory must be trusted:
+    a crafted file in it can run arbitrary code.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize AST cache.
+
+        Args:
+            cache_dir: Directory where pickled ASTs are stored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.store_error: Optional[str] = None  # First failed write; later writes are skipped
+        self._version_tag = f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+    def _cache_path(self, source: bytes) -> Path:
+        """
+        Get cache file path for the given source bytes.
+        """
+        digest = hashlib.sha256(source).hexdigest()
+        return self.cache_dir / f"{digest}-{self._version_tag}.pickle"
+
+    def parse(self, source: bytes, filename: str = '<unknown>') -> ast.Module:
+        """
+        Return the AST for source, loading it from disk when possible.
+
+        Args:
+            source: Source code of the module
+            filename: File name used in syntax error messages
+
+        Returns:
+            Parsed module node
+
+        Raises:
+            SyntaxError: If the source cannot be parsed
+        """
+        cache_path = self._cache_path(source)
+        tree = self._load(cache_path)
+        if tree is not None:
+            self.hits += 1
+            return tree
+
+        self.misses += 1
+        tree = ast.parse(source, filename=filename)
+        self._store(cache_path, tree)
+        return tree
+
+    def _load(self, cache_path: Path) -> Optional[ast.Module]:
+        """
+        Load a cached AST, treating unreadable entries as misses.
+        """
+        try:
+            with open(cache_path, 'rb') as file:
+                tree = pickle.load(file)
+        except Exception:
+            return None
+        return tree if isinstance(tree, ast.Module) else None
+
+    def _store(self, cache_path: Path, tree: ast.Module) -> None:
+        """
+        Store an AST atomically so concurrent writers never expose partial files.
+
+        The first failure is kept in store_error and disables further writes,
+        so an unwritable cache directory is reported once rather than per file.
+        """
+        if self.store_error is not None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(tree, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.store_error = f"Cannot write AST cache entry {cache_path}: {e}; AST cache writes disabled"
@@ -0,0 +1,33 @@
+"""
+Messages formatted only when they are rendered.
+"""
+
+from typing import Any
+
+
+class DeferredMessage:
+    """
+    Message whose template is formatted only when it is rendered.
+    
+    Used for errors and warnings that are often collected but never printed,
+    so the str() of their arguments is not paid up front.
+    """
+    
+    __slots__ = ('template', 'args')
+    
+    def __init__(self, template: str, *args: Any):
+        """
+        Store the template and its arguments.
+        
+        Args:
+            template: str.format template with positional fields
+            args: Values substituted into the template
+        """
+        self.template = template
+        self.args = args
+    
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
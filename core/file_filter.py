@@ -1,6 +1,10 @@
+import fnmatch
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
 
 # Check pathspec availability
 try:
@@ -11,6 +15,82 @@ except ImportError:
     print("Warning: pathspec library not available. Using simple .gitignore patterns.", file=sys.stderr)
 
 
+# Directories that are never searched for .gitignore files
+SKIPPED_DIRECTORIES = frozenset({'.git', '__pycache__', 'node_modules', '.venv'})
+
+
+def _normalize_simple_pattern(pattern: str) -> str:
+    """
+    Apply the simplifications of the fallback matcher to a .gitignore pattern.
+    """
+    # Remove leading slash if present
+    if pattern.startswith('/'):
+        pattern = pattern[1:]
+    # Simple implementation for **
+    if '**' in pattern:
+        pattern = pattern.replace('**', '*')
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def _compile_simple_pattern(pattern: str) -> Tuple[str, Optional[Pattern]]:
+    """
+    Normalize a pattern and compile it once; directory patterns get no regex.
+    """
+    pattern = _normalize_simple_pattern(pattern)
+    if pattern.startswith('!') or pattern.endswith('/'):
+        return pattern, None
+    return pattern, re.compile(fnmatch.translate(pattern))
+
+
+class SimpleGitignoreSpec:
+    """
+    Precompiled .gitignore patterns used when pathspec is not available.
+    
+    All file patterns of one .gitignore are combined into a single regex, and
+    directory patterns (ending with /) into a second prefix regex.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        """
+        Initialize simple spec.
+        
+        Args:
+            patterns: Non-empty, non-comment lines of a .gitignore file
+        """
+        self.patterns = patterns
+        file_regexes = []
+        directory_prefixes = []
+        for pattern in patterns:
+            pattern = _normalize_simple_pattern(pattern)
+            # Negation is not supported by the simple implementation
+            if pattern.startswith('!'):
+                continue
+            if pattern.endswith('/'):
+                directory_prefixes.append(re.escape(pattern))
+            else:
+                file_regexes.append(fnmatch.translate(pattern))
+        self._file_regex = self._compile(file_regexes)
+        self._directory_regex = self._compile(directory_prefixes)
+    
+    @staticmethod
+    def _compile(alternatives: List[str]) -> Optional[Pattern]:
+        """
+        Combine regex alternatives into one compiled pattern.
+        """
+        if not alternatives:
+            return None
+        return re.compile('|'.join(f'(?:{alternative})' for alternative in alternatives))
+    
+    def match_file(self, file_path: str) -> bool:
+        """
+        Check if a path relative to the .gitignore directory matches.
+        """
+        if self._file_regex is not None and self._file_regex.match(file_path):
+            return True
+        return self._directory_regex is not None and self._directory_regex.match(file_path) is not None
+
+
 class FileFilter:
     """
     Handles file filtering based on .gitignore patterns.
@@ -26,7 +106,15 @@ class FileFilter:
         """
         self.directory = Path(directory_path)
         self.use_gitignore = use_gitignore
-        self.gitignore_specs = {}  # {directory_path: GitIgnoreSpec}
+        self.gitignore_specs: Dict[str, Any] = {}  # {directory_path: GitIgnoreSpec}
+        self._specs_by_dir: Dict[str, Any] = {}  # Same specs keyed by POSIX path for parent lookups
+        # Parents shorter than the root cannot hold loaded specs ('/' and '.' give 0)
+        root = self.directory.as_posix()
+        self._root_length = 0 if root == '.' else len(root.rstrip('/'))
+        self._directory_verdicts: Dict[Path, bool] = {}  # Memoized _is_ignored_directory results
+        self._file_verdicts: Dict[Path, bool] = {}  # Memoized should_ignore results
+        self.ignored_files = 0  # Statistics of the last iter_python_files run
+        self.ignored_directories = 0
         
         if self.use_gitignore:
             self._load_gitignore_patterns()
@@ -45,41 +133,137 @@ class FileFilter:
         if file_path.name.startswith('.'):
             return True
         
-        if not self.use_gitignore:
+        # Nothing to match against without loaded .gitignore files
+        if not self.use_gitignore or not self._specs_by_dir:
             return False
         
-        if PATHSPEC_AVAILABLE:
-            return self._should_ignore_pathspec(file_path)
-        else:
-            return self._should_ignore_simple(file_path)
+        # Specs do not change after loading, so verdicts can be reused
+        verdict = self._file_verdicts.get(file_path)
+        if verdict is None:
+            verdict = self._should_ignore_pathspec(file_path)
+            self._file_verdicts[file_path] = verdict
+        return verdict
+    
+    def iter_python_files(self) -> Iterator[Path]:
+        """
+        Yield Python files in the directory that are not ignored.
+        
+        Ignored directories are pruned during the walk, so their contents are
+        never listed. Files are yielded in a stable order: each directory's
+        files by name, then its subdirectories depth first. ignored_files and
+        ignored_directories are updated as the iterator is consumed.
+        
+        Yields:
+            Paths to Python files
+        """
+        self.ignored_files = 0
+        self.ignored_directories = 0
+        check_directories = self.use_gitignore and bool(self._specs_by_dir)
+        pending = [self.directory]
+        while pending:
+            directory = pending.pop()
+            try:
+                # DirEntry carries the file type from readdir, so no per-path stat is needed
+                with os.scandir(directory) as scanner:
+                    entries = sorted(scanner, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            
+            subdirectories = []
+            for entry in entries:
+                path = directory / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if check_directories and self._is_ignored_directory(path):
+                        self.ignored_directories += 1
+                    else:
+                        subdirectories.append(path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    if self.use_gitignore and self.should_ignore(path):
+                        self.ignored_files += 1
+                        continue
+                    yield path
+            
+            # Reversed so that subdirectories are visited in name order
+            pending.extend(reversed(subdirectories))
     
     def _load_gitignore_patterns(self):
         """
         Load all .gitignore files in the project recursively.
+        
+        Directories that can never contain relevant patterns, and directories
+        already ignored by a parent .gitignore, are not descended into.
         """
         try:
-            # Find all .gitignore files recursively
-            gitignore_files = list(self.directory.rglob('.gitignore'))
-            
-            for gitignore_file in gitignore_files:
-                try:
-                    gitignore_dir = gitignore_file.parent
-                    if PATHSPEC_AVAILABLE:
-                        # Use pathspec for correct pattern processing
-                        with open(gitignore_file, 'r', encoding='utf-8') as f:
-                            patterns = f.read().splitlines()
-                        spec = pathspec.PathSpec.from_lines('gitwildmatch', patterns)
-                        self.gitignore_specs[str(gitignore_dir)] = spec
-                    else:
-                        # Simple implementation without pathspec
-                        patterns = self._load_simple_gitignore_patterns(gitignore_file)
-                        self.gitignore_specs[str(gitignore_dir)] = patterns
-                except Exception as e:
-                    print(f"Warning: Error reading .gitignore file {gitignore_file}: {e}", file=sys.stderr)
-                    continue
+            for root, dirs, files in os.walk(self.directory, topdown=True):
+                if '.gitignore' in files:
+                    self._load_gitignore_file(Path(root) / '.gitignore')
+                
+                # Prune in place so os.walk skips these subtrees
+                root_path = Path(root)
+                dirs[:] = [
+                    d for d in dirs
+                    if d not in SKIPPED_DIRECTORIES and not self._is_ignored_directory(root_path / d)
+                ]
         except Exception as e:
             print(f"Warning: Error loading .gitignore patterns: {e}", file=sys.stderr)
     
+    def _load_gitignore_file(self, gitignore_file: Path) -> None:
+        """
+        Load a single .gitignore file into gitignore_specs.
+        """
+        try:
+            gitignore_dir = gitignore_file.parent
+            spec: Any  # pathspec.PathSpec or SimpleGitignoreSpec
+            if PATHSPEC_AVAILABLE:
+                # Use pathspec for correct pattern processing
+                with open(gitignore_file, 'r', encoding='utf-8') as f:
+                    patterns = f.read().splitlines()
+                spec = pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+            else:
+                # Simple implementation without pathspec
+                spec = SimpleGitignoreSpec(self._load_simple_gitignore_patterns(gitignore_file))
+            self.gitignore_specs[str(gitignore_dir)] = spec
+            self._specs_by_dir[gitignore_dir.as_posix()] = spec
+        except Exception as e:
+            print(f"Warning: Error reading .gitignore file {gitignore_file}: {e}", file=sys.stderr)
+    
+    def _is_ignored_directory(self, dir_path: Path) -> bool:
+        """
+        Check if a directory is ignored by a .gitignore file in one of its parents.
+        
+        Results are memoized, so sibling files and subdirectories share the lookup.
+        """
+        verdict = self._directory_verdicts.get(dir_path)
+        if verdict is None:
+            # Trailing slash lets directory-only patterns such as "build/" match
+            verdict = self._matches_parent_specs(dir_path, '/')
+            self._directory_verdicts[dir_path] = verdict
+        return verdict
+    
+    def _matches_parent_specs(self, path: Path, suffix: str = '') -> bool:
+        """
+        Check path against the .gitignore specs of its parents, nearest first.
+        
+        Parents are found by slicing the path string, so no Path objects are
+        created per lookup, and the walk stops at the filtered directory since
+        .gitignore files are only loaded below it.
+        """
+        path_str = path.as_posix()
+        separator = len(path_str)
+        while True:
+            separator = path_str.rfind('/', 0, separator)
+            if separator < 0:
+                # The last parent of a relative path is the current directory
+                if path.is_absolute():
+                    return False
+                spec = self._specs_by_dir.get('.')
+                return spec is not None and bool(spec.match_file(path_str + suffix))
+            if separator < self._root_length:
+                return False
+            spec = self._specs_by_dir.get(path_str[:separator] or '/')
+            if spec is not None and spec.match_file(path_str[separator + 1:] + suffix):
+                return True
+    
     def _load_simple_gitignore_patterns(self, gitignore_file):
         """
         Simple implementation for .gitignore patterns without pathspec.
@@ -98,81 +282,38 @@ class FileFilter:
     
     def _should_ignore_pathspec(self, file_path: Path) -> bool:
         """
-        Check if file should be ignored using pathspec library.
+        Check if file should be ignored by the loaded .gitignore specs.
+        
+        The specs are pathspec objects, or SimpleGitignoreSpec when pathspec
+        is not installed, so the same check serves both cases.
         """
         try:
-            relative_path = file_path.relative_to(self.directory)
-            
-            # Check all .gitignore files that may affect this file
-            for gitignore_dir, spec in self.gitignore_specs.items():
-                gitignore_path = Path(gitignore_dir)
-                if gitignore_path in file_path.parents or gitignore_path == file_path.parent:
-                    # Check relative to the .gitignore file directory
-                    try:
-                        relative_to_gitignore = file_path.relative_to(gitignore_path)
-                        if spec.match_file(relative_to_gitignore):
-                            return True
-                    except ValueError:
-                        # File is not in .gitignore subdirectory
-                        continue
-            return False
+            # Files inside an ignored directory are ignored, as in git
+            if self._is_ignored_directory(file_path.parent):
+                return True
+            return self._matches_parent_specs(file_path)
         except Exception as e:
             print(f"Warning: Error checking .gitignore for {file_path}: {e}", file=sys.stderr)
             return False
     
-    def _should_ignore_simple(self, file_path: Path) -> bool:
-        """
-        Simple implementation for checking .gitignore patterns.
-        """
-        try:
-            relative_path = file_path.relative_to(self.directory)
-            
-            for gitignore_dir, spec in self.gitignore_specs.items():
-                gitignore_path = Path(gitignore_dir)
-                if gitignore_path in file_path.parents or gitignore_path == file_path.parent:
-                    try:
-                        relative_to_gitignore = file_path.relative_to(gitignore_path)
-                        relative_str = str(relative_to_gitignore).replace('\\', '/')
-                        
-                        # Check spec type - if it's a PathSpec object, skip
-                        if hasattr(spec, 'match_file'):
-                            # This is a PathSpec object, skip for fallback
-                            continue
-                        
-                        # This is a list of patterns for fallback
-                        for pattern in spec:
-                            if self._match_simple_pattern(relative_str, pattern):
-                                return True
-                    except ValueError:
-                        continue
-            return False
-        except Exception as e:
-            print(f"Warning: Error checking .gitignore for {file_path}: {e}", file=sys.stderr)
-            return False
+    # Delegated by uml_generator_adapter under its former pathspec-less name
+    _should_ignore_simple = _should_ignore_pathspec
     
     def _match_simple_pattern(self, file_path: str, pattern: str) -> bool:
         """
         Simple pattern matching for .gitignore patterns.
-        """
-        import fnmatch
         
-        # Remove leading slash if present
-        if pattern.startswith('/'):
-            pattern = pattern[1:]
-        
-        # Handle patterns with **
-        if '**' in pattern:
-            # Simple implementation for **
-            pattern = pattern.replace('**', '*')
+        Patterns are compiled once and reused across calls.
+        """
+        pattern, regex = _compile_simple_pattern(pattern)
         
         # Handle patterns with leading !
         if pattern.startswith('!'):
             return False  # Simplified handling
         
         # Handle directory patterns (ending with /)
-        if pattern.endswith('/'):
+        if regex is None:
             # Check if path starts with this directory
             return file_path.startswith(pattern)
         
-        # Use fnmatch for basic matching
-        return fnmatch.fnmatch(file_path, pattern) 
\ No newline at end of file
+        return regex.match(file_path) is not None
@@ -1,7 +1,11 @@
 import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, DefaultDict, Dict, Iterator, List, Any, Optional, TextIO, Tuple, Union
 
+from .deferred import DeferredMessage
 from .file_filter import FileFilter
 from .parser import PythonParser, CLASS_STYLE_CONFIG
 
@@ -11,28 +15,50 @@ class UMLGenerator:
     Handles generation of UML diagrams from Python source code.
     """
     
-    def __init__(self, directory_path: str, file_filter: FileFilter):
+    def __init__(self, directory_path: str, file_filter: FileFilter, cache_dir: Optional[str] = None, jobs: int = 1):
         """
         Initialize UML generator.
         
         Args:
             directory_path: Path to the directory containing Python files
             file_filter: FileFilter instance for filtering files
+            cache_dir: Optional directory for the persistent AST cache
+            jobs: Number of worker processes for parsing (0 uses all CPU cores)
         """
         self.directory = Path(directory_path)
         self.file_filter = file_filter
-        self.parser = PythonParser()
-        self.uml = '@startuml\n'
-        self.all_class_bases = {}
-        self.errors = []  # List for storing errors
-        self.files_with_errors = {}  # Dictionary for storing files with errors
+        self.cache_dir = cache_dir
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.parser = PythonParser(cache_dir=cache_dir)
+        self._uml_parts: List[str] = ['@startuml\n']  # Diagram fragments, joined when uml is read
+        self.all_class_bases: Dict[str, List[str]] = {}
+        self.errors: List[Union[str, DeferredMessage]] = []  # List for storing errors
+        self.files_with_errors: DefaultDict[str, List[Union[str, DeferredMessage]]] = defaultdict(list)  # Dictionary for storing files with errors
+        self.cache_hits = 0  # AST cache statistics
+        self.cache_misses = 0
+        self._cache_store_error_reported = False  # Cache write failures are reported once per run
     
-    def generate_uml(self) -> str:
+    @property
+    def uml(self) -> str:
+        """
+        PlantUML text generated so far.
+        """
+        return ''.join(self._uml_parts)
+    
+    @uml.setter
+    def uml(self, value: str) -> None:
+        self._uml_parts = [value]
+    
+    def generate_uml(self, out: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate UML for all Python files in the specified directory.
         
+        Args:
+            out: Optional text stream; when given, the diagram is written to it
+                fragment by fragment instead of being kept in memory
+            
         Returns:
-            PlantUML diagram as string
+            PlantUML diagram as string, or None when it was written to out
         """
         try:
             # Check directory existence
@@ -40,98 +66,116 @@ class UMLGenerator:
                 error_msg = f"Directory not found: {self.directory}"
                 self.errors.append(error_msg)
                 print(f"Error: {error_msg}")
-                return "@startuml\n@enduml"
+                return self._emit_uml("@startuml\n@enduml", out)
             
             # Check directory read permissions
             if not os.access(self.directory, os.R_OK):
                 error_msg = f"Permission denied reading directory: {self.directory}"
                 self.errors.append(error_msg)
                 print(f"Error: {error_msg}")
-                return "@startuml\n@enduml"
+                return self._emit_uml("@startuml\n@enduml", out)
             
-            pathlist = list(self.directory.rglob('*.py'))
+            pathlist = list(self.file_filter.iter_python_files())
             
-            if self.file_filter.use_gitignore:
-                original_count = len(pathlist)
-                pathlist = [path for path in pathlist if not self.file_filter.should_ignore(path)]
-                ignored_count = original_count - len(pathlist)
-                if ignored_count > 0:
-                    print(f"Info: {ignored_count} Python files ignored due to .gitignore patterns")
+            if self.file_filter.ignored_files > 0:
+                print(f"Info: {self.file_filter.ignored_files} Python files ignored due to .gitignore patterns")
+            if self.file_filter.ignored_directories > 0:
+                print(f"Info: {self.file_filter.ignored_directories} directories skipped due to .gitignore patterns")
             
             if not pathlist:
                 print(f"Warning: No Python files found in {self.directory}")
-                return "@startuml\nnote right : Директория пуста\n@enduml"
+                return self._emit_uml("@startuml\nnote right : Директория пуста\n@enduml", out)
                 
         except Exception as e:
             error_msg = f"Error scanning directory {self.directory}: {e}"
             self.errors.append(error_msg)
             print(f"Error: {error_msg}")
-            return "@startuml\n@enduml"
+            return self._emit_uml("@startuml\n@enduml", out)
         
-        for path in pathlist:
-            try:
-                relative_path = path.relative_to(self.directory).with_suffix('')
-                package_name = str(relative_path).replace('/', '.').replace('\\', '.')  # Handle paths for both Windows and Unix
-                
-                # Parse file
-                parsed_data = self.parser.parse_file(path)
-                class_infos = parsed_data["classes"]
-                function_infos = parsed_data["functions"]
-                global_vars = parsed_data["global_vars"]
-                class_bases = parsed_data["class_bases"]
-
-                # Pass errors from parser to generator
-                self.errors.extend(self.parser.errors)
-                self.files_with_errors.update(self.parser.files_with_errors)
-
-                self.all_class_bases.update(class_bases)
-                
-                # Check if there are errors in this file
-                file_has_errors = str(path) in self.parser.files_with_errors
-                
-                if file_has_errors:
-                    # File with errors - red color and special icon
-                    self.uml += f'package "{package_name}" <<Frame>> #FF0000 {{\n'
-                    # Add comment with error descriptions
-                    self.uml += f'  note right : Ошибки:\n'
-                    for error in self.parser.files_with_errors[str(path)]:
-                        self.uml += f'  note right : - {error}\n'
-                else:
-                    # Regular file - standard color
-                    self.uml += f'package "{package_name}" <<Frame>> #F0F0FF {{\n'
-                
-                if global_vars:
-                    self.uml += '  class "Global Variables" << (V,#AAAAFF) >> {\n'
-                    for prefix, var in global_vars:
-                        self.uml += f"    {prefix} {var}\n"
-                    self.uml += '  }\n'
-                for function_signature in function_infos:
-                    self.uml += f'  class "{function_signature}" << (F,#DDDD00) >> {{\n  }}\n'
-                for class_info in class_infos:
-                    self.uml += self._format_class_info(class_info)
-
-                self.uml += '}\n'
-                
-            except Exception as e:
-                error_msg = f"Error processing file {path}: {e}"
-                self.errors.append(error_msg)
-                if str(path) not in self.files_with_errors:
-                    self.files_with_errors[str(path)] = []
-                self.files_with_errors[str(path)].append(error_msg)
-                print(f"Warning: {error_msg}")
+        write: Callable[[str], Any]
+        if out is not None:
+            # Stream the header and every fragment as soon as it is ready
+            out.write(''.join(self._uml_parts))
+            self._uml_parts = []
+            write = out.write
+        else:
+            write = self._uml_parts.append
+        
+        for path, result in zip(pathlist, self._process_files(pathlist)):
+            path_str = str(path)
+            if isinstance(result, Exception):
+                error = DeferredMessage("Error processing file {}: {}", path_str, result)
+                self.errors.append(error)
+                self.files_with_errors[path_str].append(error)
                 continue
+            
+            write(result["uml"])
+            self.all_class_bases.update(result["class_bases"])
+            if result["errors"]:
+                self.errors.extend(result["errors"])
+                self.files_with_errors[path_str] = result["errors"]
+            self.cache_hits += result["cache_hits"]
+            self.cache_misses += result["cache_misses"]
+            if result["cache_store_error"] and not self._cache_store_error_reported:
+                # Every worker disables its own cache writes; one message covers them all
+                self.errors.append(result["cache_store_error"])
+                self._cache_store_error_reported = True
         
         try:
             self._add_inheritance_relations()
         except Exception as e:
-            error_msg = f"Error adding inheritance relations: {e}"
-            self.errors.append(error_msg)
-            print(f"Warning: {error_msg}")
+            self.errors.append(DeferredMessage("Error adding inheritance relations: {}", e))
         
-        self.uml += '@enduml'
-        return self.uml
+        self._uml_parts.append('@enduml')
+        if out is not None:
+            out.writelines(self._uml_parts)
+            self._uml_parts = []
+            return None
+        # Collapse the fragments so later reads of uml do not join them again
+        uml = ''.join(self._uml_parts)
+        self.uml = uml
+        return uml
     
-    def _format_class_info(self, class_info: tuple) -> str:
+    def _emit_uml(self, text: str, out: Optional[TextIO]) -> Optional[str]:
+        """
+        Return a complete diagram, or write it to out when streaming.
+        """
+        if out is None:
+            return text
+        out.write(text)
+        return None
+    
+    def _process_files(self, pathlist: List[Path]) -> Iterator[Union[Dict[str, Any], Exception]]:
+        """
+        Process files serially or in worker processes.
+        
+        Results are yielded in pathlist order as soon as each one is ready, so
+        the caller assembles the diagram while later files are still parsed.
+        
+        Args:
+            pathlist: Python files to process
+            
+        Yields:
+            Either a process_file result or the raised exception, aligned with pathlist
+        """
+        if self.jobs <= 1 or len(pathlist) < 2:
+            for path in pathlist:
+                result: Union[Dict[str, Any], Exception]
+                try:
+                    result = process_file(path, self.directory, self.parser)
+                except Exception as e:
+                    result = e
+                yield result
+            return
+        
+        # No more workers than files, so small runs do not start idle processes
+        workers = min(self.jobs, len(pathlist))
+        # Several files per task amortize the inter-process round trip
+        chunksize = max(1, len(pathlist) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.cache_dir,)) as executor:
+            yield from executor.map(_process_file_in_worker, pathlist, [self.directory] * len(pathlist), chunksize=chunksize)
+    
+    def _format_class_info(self, class_info: Tuple[Any, ...]) -> str:
         """
         Format the information of a class for UML representation.
         
@@ -141,80 +185,198 @@ class UMLGenerator:
         Returns:
             Formatted class string for UML
         """
-        try:
-            class_name, fields, attributes, static_methods, methods, properties, class_type, bases = class_info
-            
-            # Get style configuration for the class type
-            style_config = CLASS_STYLE_CONFIG.get(class_type, CLASS_STYLE_CONFIG["class"])
-            keyword = style_config["keyword"]
-            color = style_config["color"]
-            
-            # Format class declaration with optional background color
-            if color:
-                class_str = f"  {keyword} \"{class_name}\" << (C,{color}) >> {{\n"
-            else:
-                class_str = f"  {keyword} \"{class_name}\" {{\n"
-            
-            # Process fields
-            for prefix, field in fields:
-                try:
-                    class_str += f"    {prefix} {field}\n"
-                except Exception as e:
-                    # Skip problematic fields
-                    continue
-                    
-            if len(fields) and (len(methods) or len(properties)):
-                class_str += "    ....\n"
-
-            # Process properties
-            for prefix, property_info in properties:
-                try:
-                    class_str += f"    {prefix} {property_info}\n"
-                except Exception as e:
-                    # Skip problematic properties
-                    continue
+        return format_class_info(class_info)
+    
+    def _add_inheritance_relations(self) -> None:
+        """
+        Add inheritance relationships between classes to the UML.
+        """
+        for class_name, bases in self.all_class_bases.items():
+            for base in bases:
+                self._uml_parts.append(f"{base} <|-- {class_name}\n")
 
-            # Process methods
-            for prefix, method in methods:
-                try:
-                    class_str += f"    {prefix} {method}\n"
-                except Exception as e:
-                    # Skip problematic methods
-                    continue
 
-            if (len(fields) or len(methods) or len(properties)) and (len(attributes) or len(static_methods)):
-                class_str += "    __Static__\n"
+def format_class_info(class_info: Tuple[Any, ...]) -> str:
+    """
+    Format the information of a class for UML representation.
+    
+    Identical classes, such as generated code or mixins repeated across
+    packages, are formatted once and served from a bounded cache.
+    
+    Args:
+        class_info: Tuple containing class information
+        
+    Returns:
+        Formatted class string for UML
+    """
+    try:
+        # Member lists become tuples so the whole class_info can be a cache key; the
+        # resolved style is part of the key, so CLASS_STYLE_CONFIG changes take effect
+        key = tuple(tuple(item) if isinstance(item, list) else item for item in class_info)
+        style_config = CLASS_STYLE_CONFIG.get(class_info[6], CLASS_STYLE_CONFIG["class"])
+        return _format_class_info_cached(key, style_config["keyword"], style_config["color"])
+    except (TypeError, IndexError):
+        # Unhashable or incomplete class information cannot be cached
+        return _format_class_info(class_info)
 
-            # Process attributes
-            for prefix, attribute in attributes:
-                try:
-                    class_str += f"    {prefix} {attribute}\n"
-                except Exception as e:
-                    # Skip problematic attributes
-                    continue
 
-            if len(attributes) and len(static_methods):
-                class_str += "    ....\n"
+@lru_cache(maxsize=4096)
+def _format_class_info_cached(class_info: Tuple[Any, ...], keyword: str, color: Optional[str]) -> str:
+    """
+    Cached variant of _format_class_info for hashable class information.
+    
+    Args:
+        class_info: Class information with member lists converted to tuples
+        keyword: Style keyword of the class type, used only as part of the cache key
+        color: Style color of the class type, used only as part of the cache key
+        
+    Returns:
+        Formatted class string for UML
+    """
+    return _format_class_info(class_info)
 
-            # Process static methods
-            for prefix, method in static_methods:
-                try:
-                    class_str += f"    {prefix} {method}\n"
-                except Exception as e:
-                    # Skip problematic static methods
-                    continue
 
-            class_str += "  }\n"
-            return class_str
-        except Exception as e:
-            # Return basic information in case of error
-            class_name = class_info[0] if len(class_info) > 0 else 'UnknownClass'
-            return f"  class {class_name} {{\n  }}\n"
+def _format_class_info(class_info: Tuple[Any, ...]) -> str:
+    """
+    Build the UML text of a class.
+    """
+    try:
+        class_name, fields, attributes, static_methods, methods, properties, class_type, bases = class_info
+        
+        # Get style configuration for the class type
+        style_config = CLASS_STYLE_CONFIG.get(class_type, CLASS_STYLE_CONFIG["class"])
+        keyword = style_config["keyword"]
+        color = style_config["color"]
+        
+        # Format class declaration with optional background color
+        if color:
+            parts = [f"  {keyword} \"{class_name}\" << (C,{color}) >> {{\n"]
+        else:
+            parts = [f"  {keyword} \"{class_name}\" {{\n"]
+        
+        # Process fields
+        parts.extend([f"    {prefix} {field}\n" for prefix, field in fields])
+        
+        if len(fields) and (len(methods) or len(properties)):
+            parts.append("    ....\n")
+
+        # Process properties
+        parts.extend([f"    {prefix} {property_info}\n" for prefix, property_info in properties])
+
+        # Process methods
+        parts.extend([f"    {prefix} {method}\n" for prefix, method in methods])
+
+        if (len(fields) or len(methods) or len(properties)) and (len(attributes) or len(static_methods)):
+            parts.append("    __Static__\n")
+
+        # Process attributes
+        parts.extend([f"    {prefix} {attribute}\n" for prefix, attribute in attributes])
+
+        if len(attributes) and len(static_methods):
+            parts.append("    ....\n")
+
+        # Process static methods
+        parts.extend([f"    {prefix} {method}\n" for prefix, method in static_methods])
+
+        parts.append("  }\n")
+        return ''.join(parts)
+    except Exception as e:
+        # Return basic information in case of error
+        class_name = class_info[0] if len(class_info) > 0 else 'UnknownClass'
+        return f"  class {class_name} {{\n  }}\n"
+
+
+def process_file(path: Path, directory: Path, parser: Optional[PythonParser] = None) -> Dict[str, Any]:
+    """
+    Parse a Python file and build its UML package fragment.
     
-    def _add_inheritance_relations(self):
-        """
-        Add inheritance relationships between classes to the UML.
-        """
-        for class_name, bases in self.all_class_bases.items():
-            for base in bases:
-                self.uml += f"{base} <|-- {class_name}\n" 
\ No newline at end of file
+    The function does not modify generator state, so it can run in worker processes.
+    Files without classes, functions, global variables or errors, such as
+    import-only __init__.py modules, produce an empty fragment.
+    
+    Args:
+        path: Path to the Python file
+        directory: Root directory used to derive the package name
+        parser: Parser to use; a new one is created when omitted
+        
+    Returns:
+        Dictionary with keys: uml, class_bases, errors, cache_hits, cache_misses,
+        cache_store_error (the AST cache write failure, or None)
+    """
+    if parser is None:
+        parser = PythonParser()
+    
+    error_start = len(parser.errors)
+    hits_start, misses_start = (parser.ast_cache.hits, parser.ast_cache.misses) if parser.ast_cache else (0, 0)
+    
+    # Parse file
+    parsed_data = parser.parse_file(path)
+    class_infos = parsed_data["classes"]
+    function_infos = parsed_data["functions"]
+    global_vars = parsed_data["global_vars"]
+    errors = parser.errors[error_start:]
+    
+    if class_infos or function_infos or global_vars or errors:
+        uml = _format_package(path, directory, class_infos, function_infos, global_vars, errors)
+    else:
+        uml = ''
+    
+    hits_end, misses_end = (parser.ast_cache.hits, parser.ast_cache.misses) if parser.ast_cache else (0, 0)
+    return {
+        "uml": uml,
+        "class_bases": parsed_data["class_bases"],
+        "errors": errors,
+        "cache_hits": hits_end - hits_start,
+        "cache_misses": misses_end - misses_start,
+        "cache_store_error": parser.ast_cache.store_error if parser.ast_cache else None
+    }
+
+
+def _format_package(path: Path, directory: Path, class_infos: List[Tuple[Any, ...]], function_infos: List[str],
+                    global_vars: List[Tuple[str, str]], errors: List[str]) -> str:
+    """
+    Build the UML package block of a parsed file.
+    """
+    # Path parts already split on the platform separator, so no string replacing is needed
+    package_name = '.'.join(path.relative_to(directory).with_suffix('').parts)
+    
+    if errors:
+        # File with errors - red color and special icon
+        parts = ['package "' + package_name + '" <<Frame>> #FF0000 {\n']
+        # Add comment with error descriptions
+        parts.append('  note right : Ошибки:\n')
+        parts.extend([f'  note right : - {error}\n' for error in errors])
+    else:
+        # Regular file - standard color
+        parts = ['package "' + package_name + '" <<Frame>> #F0F0FF {\n']
+    
+    if global_vars:
+        parts.append('  class "Global Variables" << (V,#AAAAFF) >> {\n')
+        parts.extend([f"    {prefix} {var}\n" for prefix, var in global_vars])
+        parts.append('  }\n')
+    parts.extend([f'  class "{function_signature}" << (F,#DDDD00) >> {{\n  }}\n' for function_signature in function_infos])
+    parts.extend([format_class_info(class_info) for class_info in class_infos])
+    parts.append('}\n')
+    return ''.join(parts)
+
+
+# Parser owned by the current worker process, created by _init_worker
+_worker_parser: Optional[PythonParser] = None
+
+
+def _init_worker(cache_dir: Optional[str]) -> None:
+    """
+    Create the parser reused by all tasks of a worker process.
+    """
+    global _worker_parser
+    _worker_parser = PythonParser(cache_dir=cache_dir)
+
+
+def _process_file_in_worker(path: Path, directory: Path) -> Union[Dict[str, Any], Exception]:
+    """
+    Run process_file in a worker, returning the exception instead of raising it.
+    """
+    try:
+        return process_file(path, directory, _worker_parser)
+    except Exception as e:
+        return e
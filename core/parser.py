@@ -1,7 +1,12 @@
 import ast
-import os
+import re
+import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, List, Sequence, Tuple, Any, Optional, Union
+
+from .ast_cache import ASTCache
+from .file_filter import FileFilter
 
 
 # Configuration for class type styling
@@ -29,15 +34,62 @@ CLASS_STYLE_CONFIG = {
 }
 
 
+# (prefix, text) pairs describing class members and global variables
+Members = List[Tuple[str, str]]
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+# Decorators that define the method kind and are not shown in method names
+_METHOD_KIND_DECORATORS = frozenset({'staticmethod', 'classmethod', 'abstractmethod'})
+
+# Start of a top-level class, function or decorator line, used to isolate syntax errors
+_TOP_LEVEL_BLOCK = re.compile(r'^(?=@|class\b|def\b|async\s+def\b)', re.MULTILINE)
+
+# Source made only of blank lines and ASCII comments, which always parses to an empty module
+_COMMENT_ONLY_SOURCE = re.compile(rb'(?:[ \t\f]*(?:#[\x01-\x09\x0b\x0c\x0e-\x7f]*)?(?:\r\n?|\n))*'
+                                  rb'[ \t\f]*(?:#[\x01-\x09\x0b\x0c\x0e-\x7f]*)?')
+
+# Sort key for members: the text part of a (prefix, text) pair
+_member_text = itemgetter(1)
+
+
+def _sorted_members(members: Members) -> Members:
+    """
+    Deduplicate members and sort them by text.
+    
+    Empty and single-member lists, the common case for most member kinds,
+    are returned as they are without allocating a copy.
+    """
+    if len(members) < 2:
+        return members
+    return sorted(dict.fromkeys(members), key=_member_text)
+
+
+# Shared (prefix, visibility) results returned by PythonParser._visibility
+_VISIBILITY_MAGIC = (sys.intern('~'), 'private')
+_VISIBILITY_PRIVATE = (sys.intern('-'), 'private')
+_VISIBILITY_PROTECTED = (sys.intern('#'), 'protected')
+_VISIBILITY_PUBLIC = (sys.intern('+'), 'public')
+_PUBLIC_PREFIX = _VISIBILITY_PUBLIC[0]
+
+
 class PythonParser:
     """
     Handles parsing of Python source code to extract classes, functions, and variables.
     """
     
-    def __init__(self):
-        """Initialize Python parser."""
-        self.errors = []  # List for storing errors
-        self.files_with_errors = {}  # Dictionary for storing files with errors
+    def __init__(self, cache_dir: Optional[str] = None, cache_results: bool = False):
+        """
+        Initialize Python parser.
+        
+        Args:
+            cache_dir: Optional directory for the persistent AST cache
+            cache_results: Whether to keep parse results in memory, keyed by file modification time and size
+        """
+        self.errors: List[str] = []  # List for storing errors
+        self.files_with_errors: Dict[str, List[str]] = {}  # Dictionary for storing files with errors
+        self.ast_cache = ASTCache(cache_dir) if cache_dir else None
+        # {file_path: ((st_mtime_ns, st_size), result, errors)}
+        self._result_cache: Optional[Dict[str, Tuple[Tuple[int, int], Dict[str, Any], List[str]]]] = {} if cache_results else None
     
     def parse_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -49,151 +101,93 @@ class PythonParser:
         Returns:
             Dictionary containing parsed data with keys: classes, functions, global_vars, class_bases
         """
+        if self._result_cache is None:
+            return self._parse_file_uncached(file_path)
+        
         try:
-            # Check file existence
-            if not file_path.exists():
-                error_msg = f"File not found: {file_path}"
-                self.errors.append(error_msg)
-                self.files_with_errors[str(file_path)] = [error_msg]
-                print(f"Warning: {error_msg}")
-                return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
-            
-            # Check read permissions
-            if not os.access(file_path, os.R_OK):
-                error_msg = f"Permission denied reading file: {file_path}"
-                self.errors.append(error_msg)
-                self.files_with_errors[str(file_path)] = [error_msg]
-                print(f"Warning: {error_msg}")
-                return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
-            
-            with open(file_path, "r", encoding='utf-8') as file:
-                try:
-                    content = file.read()
-                    node = ast.parse(content, filename=file_path.name)
-                except SyntaxError as e:
-                    error_msg = f"Syntax error in {file_path}: {e}"
-                    self.errors.append(error_msg)
-                    self.files_with_errors[str(file_path)] = [error_msg]
-                    print(f"Warning: {error_msg}")
-                    # Attempt partial parsing of individual blocks
-                    return self._parse_file_partially(content, file_path)
-                except UnicodeDecodeError as e:
-                    error_msg = f"Encoding error in {file_path}: {e}"
-                    self.errors.append(error_msg)
-                    self.files_with_errors[str(file_path)] = [error_msg]
-                    print(f"Warning: {error_msg}")
-                    return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
-                
+            stat = file_path.stat()
+        except OSError:
+            # Let the regular path report the error
+            return self._parse_file_uncached(file_path)
+        
+        path_str = str(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._result_cache.get(path_str)
+        if cached is not None and cached[0] == signature:
+            _, result, errors = cached
+            # Replay errors so callers see the same state as after a real parse
+            if errors:
+                self.errors.extend(errors)
+                self.files_with_errors[path_str] = list(errors)
+            return dict(result)
+        
+        error_start = len(self.errors)
+        result = self._parse_file_uncached(file_path)
+        self._result_cache[path_str] = (signature, result, self.errors[error_start:])
+        return dict(result)
+    
+    def _parse_file_uncached(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Read and parse a Python file without consulting the result cache.
+        """
+        try:
+            # A single read replaces separate existence and permission probes
+            source = file_path.read_bytes()
+        except FileNotFoundError:
+            return self._file_error(file_path, f"File not found: {file_path}")
+        except PermissionError:
+            return self._file_error(file_path, f"Permission denied reading file: {file_path}")
         except Exception as e:
-            error_msg = f"Unexpected error reading {file_path}: {e}"
-            self.errors.append(error_msg)
-            self.files_with_errors[str(file_path)] = [error_msg]
-            print(f"Warning: {error_msg}")
-            return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
+            return self._file_error(file_path, f"Unexpected error reading {file_path}: {e}")
         
-        classes = []
-        functions = []
-        class_bases = {}
-        global_vars = []
+        # Empty and comment-only files need no parse; a coding declaration may name an
+        # unknown encoding, and anything else may hide a syntax error, so both are parsed
+        if b'coding' not in source and _COMMENT_ONLY_SOURCE.fullmatch(source):
+            return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
         
         try:
-            for n in node.body:
-                if isinstance(n, ast.ClassDef):
-                    try:
-                        class_name, fields, attributes, static_methods, methods, properties, abstract_method_count = self._process_class_def(n)
-                        total_method_count = len(static_methods) + len(methods)
-                        bases = [base.id for base in n.bases if isinstance(base, ast.Name)]
-                        decorators = self._extract_decorators(n)
-                        class_type = self._determine_class_type(len(fields) > 0, abstract_method_count, total_method_count, bases, decorators)
-                        class_bases[class_name] = bases
-                        classes.append((
-                            class_name,
-                            sorted(list(set(fields)), key=lambda x: x[1]),
-                            sorted(list(set(attributes)), key=lambda x: x[1]),
-                            sorted(list(set(static_methods)), key=lambda x: x[1]),
-                            sorted(list(set(methods)), key=lambda x: x[1]),
-                            sorted(list(set(properties)), key=lambda x: x[1]),
-                            class_type,
-                            bases
-                        ))
-                    except Exception as e:
-                        error_msg = f"Error processing class in {file_path}: {e}"
-                        self.errors.append(error_msg)
-                        if str(file_path) not in self.files_with_errors:
-                            self.files_with_errors[str(file_path)] = []
-                        self.files_with_errors[str(file_path)].append(error_msg)
-                        print(f"Warning: {error_msg}")
-                        continue
-                        
-                elif isinstance(n, ast.FunctionDef):
-                    try:
-                        # Check if function is a decorator
-                        if not self._is_decorator_function(n):
-                            functions.append(self._process_function_def(n))
-                    except Exception as e:
-                        error_msg = f"Error processing function in {file_path}: {e}"
-                        self.errors.append(error_msg)
-                        if str(file_path) not in self.files_with_errors:
-                            self.files_with_errors[str(file_path)] = []
-                        self.files_with_errors[str(file_path)].append(error_msg)
-                        print(f"Warning: {error_msg}")
-                        continue
-                        
-                elif isinstance(n, ast.AsyncFunctionDef):
-                    try:
-                        # Check if function is a decorator
-                        if not self._is_decorator_function(n):
-                            functions.append(self._process_function_def(n))
-                    except Exception as e:
-                        error_msg = f"Error processing async function in {file_path}: {e}"
-                        self.errors.append(error_msg)
-                        if str(file_path) not in self.files_with_errors:
-                            self.files_with_errors[str(file_path)] = []
-                        self.files_with_errors[str(file_path)].append(error_msg)
-                        print(f"Warning: {error_msg}")
-                        continue
-                        
-                elif isinstance(n, ast.Assign):
-                    try:
-                        global_vars.extend(self._process_global_vars(n))
-                    except Exception as e:
-                        error_msg = f"Error processing global variables in {file_path}: {e}"
-                        self.errors.append(error_msg)
-                        if str(file_path) not in self.files_with_errors:
-                            self.files_with_errors[str(file_path)] = []
-                        self.files_with_errors[str(file_path)].append(error_msg)
-                        print(f"Warning: {error_msg}")
-                        continue
-                        
+            # ast.parse decodes bytes itself, honouring coding declarations
+            if self.ast_cache is not None:
+                node = self.ast_cache.parse(source, filename=file_path.name)
+            else:
+                node = ast.parse(source, filename=file_path.name)
+        except SyntaxError as e:
+            try:
+                content = source.decode('utf-8')
+            except UnicodeDecodeError as decode_error:
+                return self._file_error(file_path, f"Encoding error in {file_path}: {decode_error}")
+            self._file_error(file_path, f"Syntax error in {file_path}: {e}")
+            # Attempt partial parsing of individual blocks
+            return self._parse_file_partially(content, file_path)
         except Exception as e:
-            error_msg = f"Error processing AST nodes in {file_path}: {e}"
-            self.errors.append(error_msg)
-            if str(file_path) not in self.files_with_errors:
-                self.files_with_errors[str(file_path)] = []
-            self.files_with_errors[str(file_path)].append(error_msg)
-            print(f"Warning: {error_msg}")
+            return self._file_error(file_path, f"Unexpected error reading {file_path}: {e}")
         
-        return {
-            "classes": classes,
-            "functions": functions,
-            "global_vars": global_vars,
-            "class_bases": class_bases
-        }
+        return self._process_nodes(node.body, file_path)
     
-    def parse_directory(self, directory_path: Path) -> List[Dict[str, Any]]:
+    def _file_error(self, file_path: Path, error_msg: str) -> Dict[str, Any]:
+        """
+        Record an error that prevents parsing a file and return an empty result.
+        """
+        self.errors.append(error_msg)
+        self.files_with_errors[str(file_path)] = [error_msg]
+        return {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
+    
+    def parse_directory(self, directory_path: Path, file_filter: Optional[FileFilter] = None) -> List[Dict[str, Any]]:
         """
         Parse all Python files in a directory.
         
         Args:
             directory_path: Path to the directory to parse
+            file_filter: Optional FileFilter; ignored subtrees are pruned while walking
             
         Returns:
             List of parsed data dictionaries for each file
         """
         results = []
-        python_files = list(directory_path.rglob("*.py"))
+        if file_filter is None:
+            file_filter = FileFilter(str(directory_path), use_gitignore=False)
         
-        for file_path in python_files:
+        for file_path in file_filter.iter_python_files():
             result = self.parse_file(file_path)
             result["file_path"] = file_path
             results.append(result)
@@ -203,72 +197,105 @@ class PythonParser:
     def _parse_file_partially(self, content: str, file_path: Path) -> Dict[str, Any]:
         """
         Attempt partial parsing of a file with syntax errors.
-        """
-        def try_parse_class_block(class_text: str, class_name: str) -> Tuple[List, List, List, List, List, List, int]:
+        
+        The source is split at top-level class and function definitions, each
+        block is parsed on its own, and blocks that still fail are skipped.
+        """
+        nodes: List[ast.stmt] = []
+        decorators = ''
+        for block in _TOP_LEVEL_BLOCK.split(content):
+            # Keep decorator lines together with the definition that follows them
+            if block.startswith('@'):
+                decorators += block
+                continue
+            block, decorators = decorators + block, ''
             try:
-                # Attempt to parse only the class
-                class_node = ast.parse(class_text)
-                for node in class_node.body:
-                    if isinstance(node, ast.ClassDef) and node.name == class_name:
-                        return self._process_class_def(node)
-            except:
-                pass
-            return [], [], [], [], [], [], 0
+                nodes.extend(ast.parse(block).body)
+            except SyntaxError:
+                continue
         
-        # Simple heuristic for extracting classes
-        lines = content.split('\n')
-        classes = []
-        functions = []
-        global_vars = []
-        class_bases = {}
+        return self._process_nodes(nodes, file_path)
+    
+    def _process_nodes(self, nodes: List[ast.stmt], file_path: Path) -> Dict[str, Any]:
+        """
+        Extract classes, functions, and global variables from top-level statements.
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if line.startswith('class '):
-                # Found class line
-                class_name = line.split('class ')[1].split('(')[0].split(':')[0].strip()
-                bases = []
-                if '(' in line and ')' in line:
-                    base_part = line.split('(')[1].split(')')[0]
-                    bases = [base.strip() for base in base_part.split(',') if base.strip()]
-                
-                # Find end of class
-                class_lines = [line]
-                brace_count = line.count('{') - line.count('}')
-                i += 1
-                while i < len(lines) and brace_count > 0:
-                    class_lines.append(lines[i])
-                    brace_count += lines[i].count('{') - lines[i].count('}')
-                    i += 1
-                
-                class_text = '\n'.join(class_lines)
-                fields, attributes, static_methods, methods, properties, abstract_method_count = try_parse_class_block(class_text, class_name)
-                class_bases[class_name] = bases
-                classes.append((
-                    class_name,
-                    sorted(list(set(fields)), key=lambda x: x[1]),
-                    sorted(list(set(attributes)), key=lambda x: x[1]),
-                    sorted(list(set(static_methods)), key=lambda x: x[1]),
-                    sorted(list(set(methods)), key=lambda x: x[1]),
-                    sorted(list(set(properties)), key=lambda x: x[1]),
-                    "class",
-                    bases
-                ))
-            elif line.startswith('def '):
-                # Found function
-                func_name = line.split('def ')[1].split('(')[0].strip()
-                functions.append(f"+ {func_name}()")
-            i += 1
+        Args:
+            nodes: Top-level statements of a module
+            file_path: Path to the source file, used in error messages
+            
+        Returns:
+            Dictionary containing parsed data with keys: classes, functions, global_vars, class_bases
+        """
+        result: Dict[str, Any] = {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
+        handlers = self._NODE_HANDLERS
+        kind = "AST nodes"
         
-        return {
-            "classes": classes,
-            "functions": functions,
-            "global_vars": global_vars,
-            "class_bases": class_bases
-        }
+        # One try block covers the whole loop; after a failure the loop resumes
+        # with the next node from the same iterator
+        remaining = iter(nodes)
+        while True:
+            try:
+                for n in remaining:
+                    entry = handlers.get(type(n))
+                    if entry is not None:
+                        handler, kind = entry
+                        handler(self, n, result)
+                return result
+            except Exception as e:
+                self._emit_error(str(file_path), f"Error processing {kind} in {file_path}: {e}")
     
-    def _process_class_def(self, node: ast.ClassDef) -> Tuple[str, List, List, List, List, int]:
+    def _emit_error(self, file_path_str: str, error_msg: str) -> None:
+        """
+        Record an error and append it to the errors of its file.
+        """
+        self.errors.append(error_msg)
+        self.files_with_errors.setdefault(file_path_str, []).append(error_msg)
+    
+    def _collect_class(self, node: ast.ClassDef, result: Dict[str, Any]) -> None:
+        """
+        Add a top-level class definition to the parse result.
+        """
+        class_name, fields, attributes, static_methods, methods, properties, abstract_method_count = self._process_class_def(node)
+        total_method_count = len(static_methods) + len(methods)
+        bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+        decorators = self._extract_decorators(node)
+        class_type = self._determine_class_type(len(fields) > 0, abstract_method_count, total_method_count, bases, decorators)
+        result["class_bases"][class_name] = bases
+        result["classes"].append((
+            class_name,
+            _sorted_members(fields),
+            _sorted_members(attributes),
+            _sorted_members(static_methods),
+            _sorted_members(methods),
+            _sorted_members(properties),
+            class_type,
+            bases
+        ))
+    
+    def _collect_function(self, node: FunctionNode, result: Dict[str, Any]) -> None:
+        """
+        Add a top-level function definition to the parse result.
+        """
+        # Check if function is a decorator
+        if not self._is_decorator_function(node):
+            result["functions"].append(self._process_function_def(node))
+    
+    def _collect_global_vars(self, node: ast.Assign, result: Dict[str, Any]) -> None:
+        """
+        Add global variable assignments to the parse result.
+        """
+        result["global_vars"].extend(self._process_global_vars(node))
+    
+    # Top-level statement handlers and the node kind used in error messages, keyed by exact node type
+    _NODE_HANDLERS: Dict[type, Tuple[Callable[..., None], str]] = {
+        ast.ClassDef: (_collect_class, "class"),
+        ast.FunctionDef: (_collect_function, "function"),
+        ast.AsyncFunctionDef: (_collect_function, "async function"),
+        ast.Assign: (_collect_global_vars, "global variables"),
+    }
+    
+    def _process_class_def(self, node: ast.ClassDef) -> Tuple[str, Members, Members, Members, Members, Members, int]:
         """
         Process a class definition node to extract its components.
         """
@@ -283,7 +310,8 @@ class PythonParser:
             abstract_method_count = 0
             static_methods = []
             for body_item in node.body:
-                if isinstance(body_item, ast.FunctionDef):
+                # Member kinds are matched by exact node type; ast node classes are leaves
+                if type(body_item) is ast.FunctionDef:
                     try:
                         # Check if this is a property
                         is_property = self._is_property_method(body_item)
@@ -309,7 +337,7 @@ class PythonParser:
                         # Skip problematic methods
                         continue
 
-                elif isinstance(body_item, ast.AsyncFunctionDef):
+                elif type(body_item) is ast.AsyncFunctionDef:
                     try:
                         prefix, method_signature, is_abstract, is_static, is_class = self._process_method_def(body_item)
                         if is_abstract:
@@ -322,7 +350,7 @@ class PythonParser:
                         # Skip problematic methods
                         continue
 
-                elif isinstance(body_item, ast.ClassDef):
+                elif type(body_item) is ast.ClassDef:
                     # Recursively process nested classes
                     try:
                         # Simply skip nested classes for simplification
@@ -332,7 +360,7 @@ class PythonParser:
                         # Skip problematic nested classes
                         continue
 
-                elif isinstance(body_item, ast.AnnAssign):
+                elif type(body_item) is ast.AnnAssign:
                     try:
                         attributes.extend(self._process_attributes(body_item))
                     except Exception as e:
@@ -343,7 +371,7 @@ class PythonParser:
             # Return empty values in case of error
             return "UnknownClass", [], [], [], [], [], 0
     
-    def _process_method_def(self, body_item: ast.FunctionDef) -> Tuple[str, str, bool, bool, bool]:
+    def _process_method_def(self, body_item: FunctionNode) -> Tuple[str, str, bool, bool, bool]:
         """
         Process a method definition node to extract its signature and properties.
         """
@@ -351,15 +379,16 @@ class PythonParser:
             # Extract decorators and format method name
             decorators = self._extract_decorators(body_item)
             
-            # Determine method type first
-            is_abstract = 'decorator_list' in body_item._fields and any(isinstance(dec, ast.Name) and dec.id == 'abstractmethod' for dec in body_item.decorator_list)
-            is_static = 'decorator_list' in body_item._fields and any(isinstance(dec, ast.Name) and dec.id == 'staticmethod' for dec in body_item.decorator_list)
-            is_class = 'decorator_list' in body_item._fields and any(isinstance(dec, ast.Name) and dec.id == 'classmethod' for dec in body_item.decorator_list)
+            # Determine method type first, scanning the decorators once
+            decorator_ids = {dec.id for dec in body_item.decorator_list if isinstance(dec, ast.Name)}
+            is_abstract = 'abstractmethod' in decorator_ids
+            is_static = 'staticmethod' in decorator_ids
+            is_class = 'classmethod' in decorator_ids
             
             # For static, class, and abstract methods, exclude their decorators from name
             if is_static or is_class or is_abstract:
                 # Remove staticmethod/classmethod/abstractmethod decorators from the list
-                filtered_decorators = [d for d in decorators if d not in ['staticmethod', 'classmethod', 'abstractmethod']]
+                filtered_decorators = [d for d in decorators if d not in _METHOD_KIND_DECORATORS]
                 method_name = self._format_name_with_decorators(body_item.name, filtered_decorators)
             else:
                 method_name = self._format_name_with_decorators(body_item.name, decorators)
@@ -385,12 +414,12 @@ class PythonParser:
             # Return basic information in case of error
             return '+', f"{body_item.name if hasattr(body_item, 'name') else 'unknown'}()", False, False, False
     
-    def _process_attributes(self, body_item: ast.AnnAssign) -> List[Tuple[str, str]]:
+    def _process_attributes(self, body_item: ast.AnnAssign) -> Members:
         """
         Process attributes of a class defined using type annotations.
         """
         try:
-            if hasattr(body_item, 'target') and hasattr(body_item.target, 'id'):
+            if type(body_item.target) is ast.Name:
                 attr_name = body_item.target.id
                 prefix, vis_type = self._visibility(attr_name)
                 
@@ -407,36 +436,38 @@ class PythonParser:
         """
         Extract type annotation as string.
         """
+        # Plain names are the most common annotations, so they are checked before the try
+        if type(annotation) is ast.Name:
+            return annotation.id
         try:
-            if isinstance(annotation, ast.Name):
-                return annotation.id
-            elif isinstance(annotation, ast.Constant):
+            if type(annotation) is ast.Constant:
                 return str(annotation.value)
-            elif isinstance(annotation, ast.Attribute):
+            elif type(annotation) is ast.Attribute:
                 return f"{self._get_type_annotation(annotation.value)}.{annotation.attr}"
-            elif isinstance(annotation, ast.Subscript):
+            elif type(annotation) is ast.Subscript:
                 return f"{self._get_type_annotation(annotation.value)}[{self._get_type_annotation(annotation.slice)}]"
             else:
                 return str(annotation)
         except Exception as e:
             return "Any"
     
-    def _process_fields(self, body_item: ast.Assign) -> List[Tuple[str, str]]:
+    def _process_fields(self, body_item: ast.Assign) -> Members:
         """
         Process field assignments in class.
         """
         try:
             fields = []
             for target in body_item.targets:
-                if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == 'self':
+                if type(target) is ast.Attribute and type(target.value) is ast.Name and target.value.id == 'self':
                     field_name = target.attr
-                    prefix, vis_type = self._visibility(field_name)
+                    # Public names are the common case and need no visibility call
+                    prefix = _PUBLIC_PREFIX if field_name[:1] != '_' else self._visibility(field_name)[0]
                     fields.append((prefix, field_name))
             return fields
         except Exception as e:
             return []
     
-    def _process_function_def(self, node: ast.FunctionDef) -> str:
+    def _process_function_def(self, node: FunctionNode) -> str:
         """
         Process a function definition node.
         """
@@ -446,31 +477,30 @@ class PythonParser:
             function_name = self._format_name_with_decorators(node.name, decorators)
             
             prefix, vis_type = self._visibility(node.name)
-            args = []
             
-            for arg in node.args.args:
-                arg_name = arg.arg
-                if arg.annotation:
-                    arg_type = self._get_type_annotation(arg.annotation)
-                    args.append(f"{arg_name}: {arg_type}")
-                else:
-                    args.append(arg_name)
+            # Build the argument list in one comprehension with the annotation helper bound locally
+            get_type_annotation = self._get_type_annotation
+            args = [
+                f"{arg.arg}: {get_type_annotation(arg.annotation)}" if arg.annotation else arg.arg
+                for arg in node.args.args
+            ]
             
             function_signature = f"{prefix} {function_name}({', '.join(args)})"
             return function_signature
         except Exception as e:
             return f"+ {node.name if hasattr(node, 'name') else 'unknown'}()"
     
-    def _process_global_vars(self, node: ast.Assign) -> List[Tuple[str, str]]:
+    def _process_global_vars(self, node: ast.Assign) -> Members:
         """
         Process global variable assignments.
         """
         try:
             variables = []
             for target in node.targets:
-                if isinstance(target, ast.Name):
-                    var_name = target.id
-                    prefix, vis_type = self._visibility(var_name)
+                if type(target) is ast.Name:
+                    # Names from unpickled cached ASTs are not interned
+                    var_name = sys.intern(target.id)
+                    prefix = _PUBLIC_PREFIX if var_name[:1] != '_' else self._visibility(var_name)[0]
                     variables.append((prefix, var_name))
             return variables
         except Exception as e:
@@ -505,15 +535,23 @@ class PythonParser:
         """
         return CLASS_STYLE_CONFIG.get(class_type, CLASS_STYLE_CONFIG["class"])
     
-    def _extract_fields_from_init(self, init_method: ast.FunctionDef) -> List[Tuple[str, str]]:
+    def _extract_fields_from_init(self, init_method: ast.FunctionDef) -> Members:
         """
         Extract field assignments from __init__ method.
         """
         try:
+            # Local names keep global and attribute lookups out of the loop
+            assign_type, attribute_type, name_type = ast.Assign, ast.Attribute, ast.Name
+            visibility, public_prefix = self._visibility, _PUBLIC_PREFIX
             fields = []
             for item in init_method.body:
-                if isinstance(item, ast.Assign):
-                    fields.extend(self._process_fields(item))
+                if type(item) is not assign_type:
+                    continue
+                for target in item.targets:
+                    if type(target) is attribute_type and type(target.value) is name_type and target.value.id == 'self':
+                        field_name = target.attr
+                        prefix = public_prefix if field_name[:1] != '_' else visibility(field_name)[0]
+                        fields.append((prefix, field_name))
             return fields
         except Exception as e:
             return []
@@ -525,7 +563,7 @@ class PythonParser:
         try:
             if hasattr(node, 'body') and node.body:
                 first_item = node.body[0]
-                if isinstance(first_item, ast.Expr) and isinstance(first_item.value, ast.Constant):
+                if isinstance(first_item, ast.Expr) and isinstance(first_item.value, ast.Constant) and isinstance(first_item.value.value, str):
                     return first_item.value.value.strip()
             return ""
         except Exception as e:
@@ -535,14 +573,13 @@ class PythonParser:
         """
         Determine the visibility of a member based on its name.
         """
-        if name.startswith('__') and name.endswith('__'):
-            return '~', 'private'  # Magic
-        if name.startswith('__'):
-            return '-', 'private'  # Private
-        elif name.startswith('_'):
-            return '#', 'protected'  # Protected
-        else:
-            return '+', 'public'  # Public 
+        if name[:1] != '_':
+            return _VISIBILITY_PUBLIC
+        if name[:2] != '__':
+            return _VISIBILITY_PROTECTED
+        if name.endswith('__'):
+            return _VISIBILITY_MAGIC
+        return _VISIBILITY_PRIVATE
     
     def _extract_decorators(self, node: ast.AST) -> List[str]:
         """
@@ -598,7 +635,7 @@ class PythonParser:
         decorator_suffix = "".join(f"@{d}" for d in sorted_decorators)
         return f"{name}{decorator_suffix}"
     
-    def _is_decorator_function(self, node: ast.FunctionDef) -> bool:
+    def _is_decorator_function(self, node: FunctionNode) -> bool:
         """
         Check if a function is a decorator by analyzing its structure.
         """
@@ -671,7 +708,7 @@ class PythonParser:
         except Exception:
             return False
     
-    def _process_property_method(self, property_node: ast.FunctionDef, class_body: List[ast.AST]) -> Optional[Tuple[str, str]]:
+    def _process_property_method(self, property_node: ast.FunctionDef, class_body: Sequence[ast.AST]) -> Optional[Tuple[str, str]]:
         """
         Process a property method to determine its access level and return property info.
         """
@@ -239,4 +239,16 @@ class AnotherDerived(BaseClass):
         
         # Click may not support --version in this context
         # Check that command executes without errors
-        assert result.returncode in [0, 2]  # 0 - success, 2 - argument error 
\ No newline at end of file
+        assert result.returncode in [0, 2]  # 0 - success, 2 - argument error 
+
+    def test_cli_direct_rejects_negative_jobs(self):
+        """Тест отклонения отрицательного значения --jobs в cli_direct"""
+        from py2puml.cli_direct import create_parser
+
+        parser = create_parser()
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["generate", self.temp_dir, "out.puml", "--jobs", "-1"])
+        assert exc_info.value.code == 2
+
+        args = parser.parse_args(["generate", self.temp_dir, "out.puml", "-j", "0"])
+        assert args.jobs == 0
@@ -0,0 +1,105 @@
+import pytest
+import tempfile
+import os
+from pathlib import Path
+
+from py2puml.core.ast_cache import ASTCache
+from py2puml.core.file_filter import FileFilter
+from py2puml.core.generator import UMLGenerator
+from py2puml.core.parser import PythonParser
+
+
+class TestASTCache:
+    """Тесты для дискового кэша AST"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "_ast_cache")
+
+    def teardown_method(self):
+        """Очистка после каждого теста"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_miss_then_hit(self):
+        """Тест промаха и последующего попадания в кэш"""
+        source = b"class TestClass:\n    pass\n"
+
+        first = ASTCache(self.cache_dir)
+        first.parse(source)
+        assert first.hits == 0
+        assert first.misses == 1
+
+        second = ASTCache(self.cache_dir)
+        tree = second.parse(source)
+        assert second.hits == 1
+        assert second.misses == 0
+        assert tree.body[0].name == "TestClass"
+
+    def test_corrupted_entry_is_miss(self):
+        """Тест поврежденной записи кэша"""
+        source = b"x = 1\n"
+        cache = ASTCache(self.cache_dir)
+        cache.parse(source)
+
+        for entry in Path(self.cache_dir).iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        cache.parse(source)
+        assert cache.misses == 2
+
+    def test_syntax_error_not_cached(self):
+        """Тест того, что синтаксические ошибки не кэшируются"""
+        cache = ASTCache(self.cache_dir)
+        with pytest.raises(SyntaxError):
+            cache.parse(b"class Broken(:\n")
+        assert not os.path.exists(self.cache_dir) or not os.listdir(self.cache_dir)
+
+    def test_generator_reports_cache_statistics(self):
+        """Тест статистики кэша в генераторе"""
+        source_dir = Path(self.temp_dir) / "src"
+        source_dir.mkdir()
+        (source_dir / "module.py").write_text("class TestClass:\n    pass\n")
+
+        file_filter = FileFilter(str(source_dir), use_gitignore=False)
+        first = UMLGenerator(str(source_dir), file_filter, cache_dir=self.cache_dir)
+        first_output = first.generate_uml()
+        assert (first.cache_hits, first.cache_misses) == (0, 1)
+
+        second = UMLGenerator(str(source_dir), file_filter, cache_dir=self.cache_dir)
+        assert second.generate_uml() == first_output
+        assert (second.cache_hits, second.cache_misses) == (1, 0)
+
+    def test_unwritable_cache_reported_once(self, capsys):
+        """Тест однократного сообщения о невозможности записи в кэш"""
+        # Файл на месте каталога кэша не дает создать записи
+        Path(self.cache_dir).write_text("")
+        cache = ASTCache(self.cache_dir)
+        cache.parse(b"x = 1\n")
+        first_error = cache.store_error
+        cache.parse(b"y = 2\n")
+
+        assert first_error is not None
+        assert cache.store_error == first_error
+        assert capsys.readouterr().err == ""
+
+    def test_generator_reports_cache_write_error_once(self):
+        """Тест единственной ошибки генератора при недоступном кэше"""
+        source_dir = Path(self.temp_dir) / "src"
+        source_dir.mkdir()
+        for index in range(3):
+            (source_dir / f"module_{index}.py").write_text(f"class Class{index}:\n    pass\n")
+        Path(self.cache_dir).write_text("")
+
+        file_filter = FileFilter(str(source_dir), use_gitignore=False)
+        generator = UMLGenerator(str(source_dir), file_filter, cache_dir=self.cache_dir)
+        generator.generate_uml()
+
+        cache_errors = [error for error in generator.errors if "AST cache" in str(error)]
+        assert len(cache_errors) == 1
+
+    def test_parser_without_cache(self):
+        """Тест парсера без кэша"""
+        parser = PythonParser()
+        assert parser.ast_cache is None
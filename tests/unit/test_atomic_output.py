@@ -0,0 +1,81 @@
+import pytest
+import tempfile
+import os
+from pathlib import Path
+
+from py2puml.utils.atomic_output import AtomicOutputFile
+
+
+class TestAtomicOutputFile:
+    """Тесты для атомарной записи выходного файла"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = Path(self.temp_dir) / "diagram.puml"
+
+    def teardown_method(self):
+        """Очистка после каждого теста"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_replaces_target_on_success(self):
+        """Тест замены файла после успешной записи"""
+        self.output_path.write_text("old")
+
+        with AtomicOutputFile(self.output_path) as file:
+            file.write("@startuml\n")
+            # До завершения блока старое содержимое сохраняется
+            assert self.output_path.read_text() == "old"
+            file.write("@enduml")
+
+        assert self.output_path.read_text() == "@startuml\n@enduml"
+        assert os.listdir(self.temp_dir) == ["diagram.puml"]
+
+    def test_keeps_previous_file_on_error(self):
+        """Тест сохранения прежнего файла при ошибке генерации"""
+        self.output_path.write_text("old")
+
+        with pytest.raises(RuntimeError):
+            with AtomicOutputFile(self.output_path) as file:
+                file.write("@startuml\n")
+                raise RuntimeError("boom")
+
+        assert self.output_path.read_text() == "old"
+        assert os.listdir(self.temp_dir) == ["diagram.puml"]
+
+    def test_preserves_permissions_of_replaced_file(self):
+        """Тест сохранения прав доступа заменяемого файла"""
+        self.output_path.write_text("old")
+        os.chmod(self.output_path, 0o640)
+
+        with AtomicOutputFile(self.output_path) as file:
+            file.write("new")
+
+        assert self.output_path.stat().st_mode & 0o777 == 0o640
+
+    def test_updates_symlink_target(self):
+        """Тест записи в файл, на который указывает символическая ссылка"""
+        target = Path(self.temp_dir) / "real.puml"
+        target.write_text("old")
+        os.symlink(target, self.output_path)
+
+        with AtomicOutputFile(self.output_path) as file:
+            file.write("new")
+
+        assert self.output_path.is_symlink()
+        assert target.read_text() == "new"
+
+    def test_refuses_read_only_target(self, monkeypatch):
+        """Тест отказа перезаписывать файл без права записи"""
+        self.output_path.write_text("old")
+        os.chmod(self.output_path, 0o444)
+        if os.geteuid() == 0:
+            # root может писать в любой файл, поэтому имитируем ответ access()
+            monkeypatch.setattr(os, "access", lambda path, mode: False)
+
+        with pytest.raises(PermissionError):
+            AtomicOutputFile(self.output_path)
+
+        assert self.output_path.read_text() == "old"
+        assert os.listdir(self.temp_dir) == ["diagram.puml"]
@@ -107,6 +107,39 @@ def test_function():
         # Документация может не извлекаться из-за ограничений парсера
         # assert "This is a test function" in result
 
+    def test_documentation_parses_file_once(self):
+        """Тест однократного разбора файла при извлечении документации"""
+        python_code = """
+class First:
+    \"\"\"First class\"\"\"
+    def one(self):
+        \"\"\"Method one\"\"\"
+
+    def two(self):
+        \"\"\"Method two\"\"\"
+
+def helper():
+    \"\"\"Helper function\"\"\"
+"""
+        file_path = Path(self.temp_dir) / "documented.py"
+        file_path.write_text(python_code)
+
+        import ast
+        with patch('py2puml.core.analyzer.ast.parse', wraps=ast.parse) as parse_mock:
+            result = self.analyzer.describe_file(file_path, format='json')
+
+        # Один разбор в парсере и один для документации, независимо от числа методов
+        assert parse_mock.call_count == 2
+        assert "Method two" in result
+
+    def test_file_summary_line_count_from_content(self):
+        """Тест подсчета строк по уже прочитанному содержимому"""
+        file_path = Path(self.temp_dir) / "missing.py"
+
+        for content, expected in (("", 0), ("x = 1", 1), ("x = 1\n", 1), ("x = 1\ny = 2", 2)):
+            summary = self.analyzer._get_file_summary(file_path, [], [], [], content=content)
+            assert summary["lines"] == expected
+
     def test_various_docstring_styles(self):
         """Тест различных стилей документации"""
         python_code = '''
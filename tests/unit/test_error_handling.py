@@ -0,0 +1,290 @@
+import pytest
+import errno
+import io
+import os
+import sys
+import tempfile
+import warnings
+from pathlib import Path
+
+from py2puml.core.deferred import DeferredMessage
+from py2puml.utils import error_handling
+from py2puml.utils.error_handling import (
+    CLIError, DirectoryNotFoundError, FileNotFoundCLIError, PermissionCLIError, ValidationError,
+    print_warnings, validate_directory_path, validate_file_path, validate_output_path
+)
+
+
+class TestDeprecatedExceptionNames:
+    """Тесты для устаревших имен исключений CLI"""
+
+    def test_old_names_resolve_to_renamed_classes(self):
+        """Тест разрешения старых имен в переименованные классы"""
+        with pytest.warns(DeprecationWarning, match="FileNotFoundCLIError"):
+            assert error_handling.FileNotFoundError is FileNotFoundCLIError
+        with pytest.warns(DeprecationWarning, match="PermissionCLIError"):
+            assert error_handling.PermissionError is PermissionCLIError
+
+    def test_old_names_importable(self):
+        """Тест импорта исключений по старым именам"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            from py2puml.utils.error_handling import FileNotFoundError as OldName
+        assert OldName is FileNotFoundCLIError
+        assert issubclass(OldName, CLIError)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Тест ошибки для неизвестного атрибута модуля"""
+        with pytest.raises(AttributeError):
+            error_handling.NoSuchError
+
+
+class TestPathValidationErrors:
+    """Тесты для классификации ошибок проверки путей"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Очистка после каждого теста"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _fail_stat(self, monkeypatch, error):
+        """Подменяет os.stat в модуле, чтобы он выбрасывал ошибку"""
+        def fake_stat(path):
+            raise error
+        monkeypatch.setattr(error_handling.os, "stat", fake_stat)
+
+    def test_missing_paths_are_not_found(self):
+        """Тест ошибок отсутствия файла и директории"""
+        missing = os.path.join(self.temp_dir, "missing")
+        with pytest.raises(FileNotFoundCLIError, match="File not found"):
+            validate_file_path(missing)
+        with pytest.raises(DirectoryNotFoundError, match="Directory not found"):
+            validate_directory_path(missing)
+
+    def test_path_under_file_is_not_found(self):
+        """Тест пути внутри обычного файла (ENOTDIR)"""
+        file_path = os.path.join(self.temp_dir, "file.py")
+        open(file_path, "w").close()
+        with pytest.raises(FileNotFoundCLIError):
+            validate_file_path(os.path.join(file_path, "child.py"))
+
+    def test_permission_denied_is_permission_error(self, monkeypatch):
+        """Тест отображения EACCES в PermissionCLIError"""
+        self._fail_stat(monkeypatch, PermissionError(errno.EACCES, "Permission denied"))
+        with pytest.raises(PermissionCLIError, match="Permission denied"):
+            validate_file_path(os.path.join(self.temp_dir, "secret.py"))
+        with pytest.raises(PermissionCLIError, match="Permission denied"):
+            validate_directory_path(os.path.join(self.temp_dir, "secret"))
+
+    def test_other_os_errors_are_validation_errors(self, monkeypatch):
+        """Тест прочих ошибок ОС"""
+        self._fail_stat(monkeypatch, OSError(errno.ELOOP, "Too many levels of symbolic links"))
+        with pytest.raises(ValidationError, match="Cannot access"):
+            validate_directory_path(os.path.join(self.temp_dir, "loop"))
+
+    def test_invalid_path_is_validation_error(self):
+        """Тест недопустимого пути"""
+        with pytest.raises(ValidationError, match="Cannot access"):
+            validate_file_path("bad\0path.py")
+
+
+class TestPathChangesBetweenChecks:
+    """Тесты повторной проверки путей, изменившихся после предыдущей проверки"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+        error_handling._KNOWN_DIRECTORIES.clear()
+
+    def teardown_method(self):
+        """Очистка после каждого теста"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        error_handling._KNOWN_DIRECTORIES.clear()
+
+    def test_file_created_after_miss(self):
+        """Тест файла, созданного сразу после неудачной проверки"""
+        file_path = os.path.join(self.temp_dir, "module.py")
+        with pytest.raises(FileNotFoundCLIError):
+            validate_file_path(file_path)
+
+        open(file_path, "w").close()
+        assert validate_file_path(file_path) == Path(file_path)
+
+    def test_directory_created_by_output_validation_after_miss(self):
+        """Тест директории, созданной validate_output_path после неудачной проверки"""
+        output_dir = os.path.join(self.temp_dir, "out")
+        with pytest.raises(DirectoryNotFoundError):
+            validate_directory_path(output_dir)
+
+        validate_output_path(os.path.join(output_dir, "diagram.puml"))
+        assert validate_directory_path(output_dir) == Path(output_dir)
+
+    def test_deleted_file_not_found(self):
+        """Тест удаленного после проверки файла"""
+        file_path = os.path.join(self.temp_dir, "module.py")
+        open(file_path, "w").close()
+        validate_file_path(file_path)
+
+        os.remove(file_path)
+        with pytest.raises(FileNotFoundCLIError):
+            validate_file_path(file_path)
+
+    def test_file_replaced_by_directory(self):
+        """Тест файла, замененного директорией"""
+        path = os.path.join(self.temp_dir, "target")
+        open(path, "w").close()
+        validate_file_path(path)
+
+        os.remove(path)
+        os.mkdir(path)
+        with pytest.raises(ValidationError, match="not a file"):
+            validate_file_path(path)
+        assert validate_directory_path(path) == Path(path)
+
+
+class TestOutputDirectoryCreation:
+    """Тесты создания директорий для выходного файла"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+        error_handling._KNOWN_DIRECTORIES.clear()
+
+    def teardown_method(self):
+        """Очистка после каждого теста"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        error_handling._KNOWN_DIRECTORIES.clear()
+
+    def test_creates_missing_chain(self):
+        """Тест создания цепочки отсутствующих директорий"""
+        output_dir = os.path.join(self.temp_dir, "a", "b", "c")
+        output_path = os.path.join(output_dir, "diagram.puml")
+
+        assert validate_output_path(output_path) == Path(output_path)
+        assert os.path.isdir(output_dir)
+        assert output_dir in error_handling._KNOWN_DIRECTORIES
+
+    def test_recreates_removed_known_directory(self):
+        """Тест повторного создания удаленной запомненной директории"""
+        output_dir = os.path.join(self.temp_dir, "out")
+        output_path = os.path.join(output_dir, "diagram.puml")
+        validate_output_path(output_path)
+
+        os.rmdir(output_dir)
+        validate_output_path(output_path)
+        assert os.path.isdir(output_dir)
+
+    def test_recreates_chain_under_removed_known_ancestor(self):
+        """Тест создания цепочки, если запомненный предок был удален"""
+        import shutil
+        base_dir = os.path.join(self.temp_dir, "base")
+        validate_output_path(os.path.join(base_dir, "first.puml"))
+
+        shutil.rmtree(base_dir)
+        output_dir = os.path.join(base_dir, "nested", "deeper")
+        validate_output_path(os.path.join(output_dir, "second.puml"))
+        assert os.path.isdir(output_dir)
+
+    def test_file_in_the_way_raises_permission_error(self):
+        """Тест ошибки, когда на месте директории находится файл"""
+        blocker = os.path.join(self.temp_dir, "blocker")
+        open(blocker, "w").close()
+
+        with pytest.raises(PermissionCLIError, match="Cannot create output directory"):
+            validate_output_path(os.path.join(blocker, "diagram.puml"))
+
+
+class TestDeferredMessage:
+    """Тесты для отложенного форматирования сообщений"""
+
+    def test_formats_only_when_rendered(self):
+        """Тест форматирования только при отображении"""
+        calls = []
+
+        class Value:
+            def __str__(self):
+                calls.append(1)
+                return "value"
+
+        message = DeferredMessage("File not found: {}", Value())
+        assert calls == []
+        assert str(message) == "File not found: value"
+        assert repr(message) == repr("File not found: value")
+        assert len(calls) == 2
+
+    def test_shared_by_generator_and_cli(self):
+        """Тест общего класса для генератора и CLI"""
+        from py2puml.core import generator
+        assert generator.DeferredMessage is DeferredMessage
+        assert error_handling.DeferredMessage is DeferredMessage
+
+
+class TestErrorOutput:
+    """Тесты для вывода ошибок и предупреждений в stderr"""
+
+    def test_rendered_message_cached(self):
+        """Тест однократного форматирования сообщения ошибки"""
+        calls = []
+
+        class Value:
+            def __str__(self):
+                calls.append(1)
+                return "missing.py"
+
+        error = FileNotFoundCLIError(DeferredMessage("File not found: {}", Value()))
+        assert calls == []
+        assert error.rendered_message == "Error: File not found: missing.py\n"
+        assert error.rendered_message is error.rendered_message
+        assert len(calls) == 1
+
+    def test_handle_cli_error_with_buffered_stderr(self, capsys):
+        """Тест вывода ошибки через буфер stderr"""
+        with pytest.raises(SystemExit) as exc_info:
+            error_handling.handle_cli_error(ValidationError("Путь неверен"), exit_code=3)
+
+        assert exc_info.value.code == 3
+        assert capsys.readouterr().err == "Error: Путь неверен\n"
+
+    def test_handle_cli_error_keeps_pending_text_order(self, monkeypatch):
+        """Тест порядка вывода: ранее записанный текст идет первым"""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="ascii")
+        monkeypatch.setattr(sys, "stderr", stream)
+        stream.write("pending\n")
+
+        with pytest.raises(SystemExit):
+            error_handling.handle_cli_error(Exception("ошибка"))
+
+        assert raw.getvalue() == b"pending\nError: \\u043e\\u0448\\u0438\\u0431\\u043a\\u0430\n"
+
+    def test_handle_cli_error_without_buffer(self, monkeypatch):
+        """Тест вывода ошибки в stderr без атрибута buffer"""
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", stream)
+
+        with pytest.raises(SystemExit) as exc_info:
+            error_handling.handle_cli_error(Exception("boom"))
+
+        assert exc_info.value.code == 1
+        assert stream.getvalue() == "Error: boom\n"
+
+    def test_print_warnings(self, capsys):
+        """Тест вывода списка предупреждений"""
+        print_warnings(["first", DeferredMessage("Error processing file {}: {}", "a.py", "bad")])
+
+        assert capsys.readouterr().err == (
+            "\nWarning: 2 warnings occurred during processing:\n"
+            "  - first\n"
+            "  - Error processing file a.py: bad\n"
+        )
+
+    def test_print_warnings_empty(self, capsys):
+        """Тест отсутствия вывода без предупреждений"""
+        print_warnings([])
+        assert capsys.readouterr().err == ""
@@ -85,6 +85,69 @@ __pycache__/
         # Проверяем, что оба файла загружены
         assert len(file_filter.gitignore_specs) >= 2
 
+    def test_load_gitignore_patterns_skips_ignored_directories(self):
+        """Тест пропуска .gitignore в игнорируемых директориях"""
+        with open(Path(self.temp_dir) / ".gitignore", 'w') as f:
+            f.write("build/\n")
+
+        for name in ("build", ".git", "node_modules"):
+            nested = Path(self.temp_dir) / name
+            nested.mkdir()
+            with open(nested / ".gitignore", 'w') as f:
+                f.write("*.tmp\n")
+
+        kept_dir = Path(self.temp_dir) / "src"
+        kept_dir.mkdir()
+        with open(kept_dir / ".gitignore", 'w') as f:
+            f.write("*.tmp\n")
+
+        file_filter = FileFilter(self.temp_dir, use_gitignore=True)
+
+        assert set(file_filter.gitignore_specs) == {self.temp_dir, str(kept_dir)}
+
+    def test_iter_python_files_prunes_ignored_directories(self):
+        """Тест обхода файлов с отсечением игнорируемых директорий"""
+        with open(Path(self.temp_dir) / ".gitignore", 'w') as f:
+            f.write("build/\nignored.py\n")
+
+        build_dir = Path(self.temp_dir) / "build"
+        build_dir.mkdir()
+        (build_dir / "generated.py").write_text("x = 1\n")
+        (Path(self.temp_dir) / "ignored.py").write_text("x = 1\n")
+        (Path(self.temp_dir) / "main.py").write_text("x = 1\n")
+        (Path(self.temp_dir) / "notes.txt").write_text("text\n")
+
+        file_filter = FileFilter(self.temp_dir, use_gitignore=True)
+        files = list(file_filter.iter_python_files())
+
+        assert files == [Path(self.temp_dir) / "main.py"]
+        assert file_filter.ignored_files == 1
+        assert file_filter.ignored_directories == 1
+
+        unfiltered = FileFilter(self.temp_dir, use_gitignore=False)
+        assert len(list(unfiltered.iter_python_files())) == 3
+
+    def test_should_ignore_relative_directory(self, monkeypatch):
+        """Тест фильтрации при относительном пути к директории"""
+        with open(Path(self.temp_dir) / ".gitignore", 'w') as f:
+            f.write("build/\nskip.py\n")
+        (Path(self.temp_dir) / "build").mkdir()
+        monkeypatch.chdir(self.temp_dir)
+
+        file_filter = FileFilter(".", use_gitignore=True)
+
+        assert file_filter.should_ignore(Path("skip.py"))
+        assert file_filter.should_ignore(Path("build") / "module.py")
+        assert not file_filter.should_ignore(Path("main.py"))
+
+    def test_match_simple_pattern(self):
+        """Тест простого сопоставления паттернов"""
+        assert self.file_filter._match_simple_pattern("test.pyc", "*.pyc")
+        assert self.file_filter._match_simple_pattern("build/module.py", "/build/")
+        assert self.file_filter._match_simple_pattern("src/module.py", "src/**")
+        assert not self.file_filter._match_simple_pattern("test.py", "!test.py")
+        assert not self.file_filter._match_simple_pattern("test.py", "*.pyc")
+
     def test_load_gitignore_patterns_nonexistent(self):
         """Тест загрузки несуществующего .gitignore файла"""
         file_filter = FileFilter(self.temp_dir, use_gitignore=True)
@@ -107,6 +107,109 @@ class TestClass:
         assert result["class_bases"] == {}
         assert len(self.parser.errors) > 0
 
+    def test_parse_file_partial_recovery(self):
+        """Тест частичного разбора файла с синтаксической ошибкой"""
+        python_code = """
+GLOBAL_VALUE = 1
+
+class Broken:
+    def broken_method(self:
+        pass
+
+@decorator
+class Valid(Base):
+    def method(self):
+        pass
+
+async def fetch(url):
+    pass
+"""
+        file_path = Path(self.temp_dir) / "partial.py"
+        file_path.write_text(python_code)
+
+        result = self.parser.parse_file(file_path)
+
+        assert [class_info[0] for class_info in result["classes"]] == ["Valid@decorator"]
+        assert result["class_bases"] == {"Valid@decorator": ["Base"]}
+        assert result["functions"] == ["+ fetch(url)"]
+        assert result["global_vars"] == [("+", "GLOBAL_VALUE")]
+        assert str(file_path) in self.parser.files_with_errors
+
+    def test_parse_file_coding_declaration(self):
+        """Тест парсинга файла с объявлением кодировки"""
+        file_path = Path(self.temp_dir) / "latin.py"
+        file_path.write_bytes("# -*- coding: latin-1 -*-\nNAME = 'caf\xe9'\n".encode('latin-1'))
+
+        result = self.parser.parse_file(file_path)
+
+        assert result["global_vars"] == [("+", "NAME")]
+        assert self.parser.errors == []
+
+    def test_parse_file_comment_only(self):
+        """Тест пропуска разбора пустого файла и файла из одних комментариев"""
+        file_path = Path(self.temp_dir) / "__init__.py"
+        file_path.write_text('#!/usr/bin/env python\n\n    # Package marker\n')
+
+        with patch('py2puml.core.parser.ast.parse') as parse_mock:
+            result = self.parser.parse_file(file_path)
+
+        parse_mock.assert_not_called()
+        assert result == {"classes": [], "functions": [], "global_vars": [], "class_bases": {}}
+
+    def test_parse_file_syntax_error_without_definitions(self):
+        """Тест ошибки синтаксиса в файле без классов, функций и присваиваний"""
+        for name, source in (("imports.py", "import (\n"), ("calls.py", "print(\n")):
+            file_path = Path(self.temp_dir) / name
+            file_path.write_text(source)
+
+            result = self.parser.parse_file(file_path)
+
+            assert result["classes"] == []
+            assert str(file_path) in self.parser.files_with_errors
+        assert len(self.parser.errors) == 2
+        assert all("Syntax error" in error for error in self.parser.errors)
+
+    def test_parse_file_result_cache(self):
+        """Тест кэширования результатов по времени изменения и размеру файла"""
+        parser = PythonParser(cache_results=True)
+        file_path = Path(self.temp_dir) / "cached.py"
+        file_path.write_text("class First:\n    pass\n")
+
+        first = parser.parse_file(file_path)
+        with patch('py2puml.core.parser.ast.parse') as parse_mock:
+            second = parser.parse_file(file_path)
+        parse_mock.assert_not_called()
+        assert second == first
+
+        file_path.write_text("class Second(Base):\n    pass\n")
+        os.utime(file_path, ns=(0, 10 ** 9))
+        result = parser.parse_file(file_path)
+        assert result["class_bases"] == {"Second": ["Base"]}
+
+    def test_parse_file_result_cache_replays_errors(self):
+        """Тест повторной регистрации ошибок при попадании в кэш"""
+        parser = PythonParser(cache_results=True)
+        file_path = Path(self.temp_dir) / "broken.py"
+        file_path.write_text("class Broken(:\n")
+
+        parser.parse_file(file_path)
+        parser.parse_file(file_path)
+
+        assert len(parser.errors) == 2
+        assert str(file_path) in parser.files_with_errors
+
+    def test_parse_file_continues_after_node_error(self):
+        """Тест продолжения разбора после ошибки в одном узле"""
+        file_path = Path(self.temp_dir) / "module.py"
+        file_path.write_text("class First:\n    pass\n\nclass Second:\n    pass\n\nVALUE = 1\n")
+
+        with patch.object(PythonParser, '_determine_class_type', side_effect=[RuntimeError("boom"), "class"]):
+            result = self.parser.parse_file(file_path)
+
+        assert [class_info[0] for class_info in result["classes"]] == ["Second"]
+        assert result["global_vars"] == [("+", "VALUE")]
+        assert self.parser.files_with_errors[str(file_path)] == [f"Error processing class in {file_path}: boom"]
+
     def test_parse_file_nonexistent(self):
         """Тест парсинга несуществующего файла"""
         file_path = Path(self.temp_dir) / "nonexistent.py"
@@ -119,6 +222,19 @@ class TestClass:
         assert result["class_bases"] == {}
         assert len(self.parser.errors) > 0
 
+    def test_parse_directory_with_file_filter(self):
+        """Тест разбора директории с фильтрацией по .gitignore"""
+        (Path(self.temp_dir) / ".gitignore").write_text("build/\n")
+        (Path(self.temp_dir) / "build").mkdir()
+        (Path(self.temp_dir) / "build" / "generated.py").write_text("class Generated:\n    pass\n")
+        (Path(self.temp_dir) / "main.py").write_text("class Main:\n    pass\n")
+
+        unfiltered = self.parser.parse_directory(Path(self.temp_dir))
+        filtered = self.parser.parse_directory(Path(self.temp_dir), FileFilter(self.temp_dir))
+
+        assert len(unfiltered) == 2
+        assert [result["file_path"].name for result in filtered] == ["main.py"]
+
     def test_visibility_methods(self):
         """Тест методов определения видимости"""
         # Публичные
@@ -181,6 +297,44 @@ class TestClass:
         assert "@enduml" in uml_output
         assert "TestClass" in uml_output
 
+    def test_generate_uml_parallel_matches_serial(self):
+        """Тест совпадения параллельной и последовательной генерации"""
+        for index in range(4):
+            module_path = Path(self.temp_dir) / f"module_{index}.py"
+            module_path.write_text(f"class Class{index}(Base):\n    def method(self):\n        pass\n")
+        (Path(self.temp_dir) / "broken.py").write_text("class Broken(:\n")
+
+        serial = UMLGenerator(self.temp_dir, self.file_filter).generate_uml()
+        parallel_generator = UMLGenerator(self.temp_dir, self.file_filter, jobs=2)
+        parallel = parallel_generator.generate_uml()
+
+        assert parallel == serial
+        assert "Base <|-- Class3" in parallel
+        assert any("broken.py" in key for key in parallel_generator.files_with_errors)
+
+    def test_generate_uml_skips_files_without_definitions(self):
+        """Тест пропуска файлов без классов, функций и переменных"""
+        (Path(self.temp_dir) / "__init__.py").write_text("import os\nfrom pathlib import Path\n")
+        (Path(self.temp_dir) / "module.py").write_text("class Model:\n    pass\n")
+
+        uml_output = self.generator.generate_uml()
+
+        assert 'package "module"' in uml_output
+        assert 'package "__init__"' not in uml_output
+
+    def test_generate_uml_streams_to_output(self):
+        """Тест потоковой записи UML в файловый объект"""
+        import io
+        (Path(self.temp_dir) / "module.py").write_text("class Child(Base):\n    def method(self):\n        pass\n")
+
+        expected = UMLGenerator(self.temp_dir, self.file_filter).generate_uml()
+        out = io.StringIO()
+        result = UMLGenerator(self.temp_dir, self.file_filter).generate_uml(out=out)
+
+        assert result is None
+        assert out.getvalue() == expected
+        assert "Base <|-- Child" in out.getvalue()
+
     def test_format_class_info(self):
         """Тест форматирования информации о классе"""
         class_info = (
@@ -198,6 +352,34 @@ class TestClass:
         assert "+ field1" in formatted
         assert "+ test_method()" in formatted
 
+    def test_format_class_info_cached(self):
+        """Тест кэширования форматирования одинаковых классов"""
+        class_info = ("CachedClass", [("+", "field1")], [], [], [("+", "method()")], [], "class", [])
+
+        first = self.generator._format_class_info(class_info)
+        with patch('py2puml.core.generator._format_class_info') as format_mock:
+            second = self.generator._format_class_info(("CachedClass", [("+", "field1")], [], [], [("+", "method()")], [], "class", []))
+
+        format_mock.assert_not_called()
+        assert second == first
+
+    def test_format_class_info_follows_style_changes(self):
+        """Тест учета изменений CLASS_STYLE_CONFIG при кэшировании"""
+        from py2puml.core.parser import CLASS_STYLE_CONFIG
+        class_info = ("StyledClass", [], [], [], [("+", "method()")], [], "abstract", [])
+
+        first = self.generator._format_class_info(class_info)
+        original_color = CLASS_STYLE_CONFIG["abstract"]["color"]
+        CLASS_STYLE_CONFIG["abstract"]["color"] = "#FF0000"
+        try:
+            second = self.generator._format_class_info(class_info)
+        finally:
+            CLASS_STYLE_CONFIG["abstract"]["color"] = original_color
+
+        assert "#FFFFFF" in first
+        assert "#FF0000" in second
+        assert self.generator._format_class_info(class_info) == first
+
     def test_add_inheritance_relations(self):
         """Тест добавления отношений наследования"""
         self.generator.all_class_bases = {
@@ -14,6 +14,27 @@ class UMLGenerator:
     This class provides the same interface as the old UMLGenerator.
     """
     
+    # Old method names served directly by a component: {name: (component attribute, method name)}
+    _DELEGATED_METHODS = {
+        '_should_ignore_pathspec': ('file_filter', '_should_ignore_pathspec'),
+        '_should_ignore_simple': ('file_filter', '_should_ignore_simple'),
+        '_load_simple_gitignore_patterns': ('file_filter', '_load_simple_gitignore_patterns'),
+        '_match_simple_pattern': ('file_filter', '_match_simple_pattern'),
+        '_parse_file_partially': ('parser', '_parse_file_partially'),
+        'extract_fields_from_init': ('parser', '_extract_fields_from_init'),
+        'process_class_def': ('parser', '_process_class_def'),
+        'process_method_def': ('parser', '_process_method_def'),
+        'process_attributes': ('parser', '_process_attributes'),
+        'get_type_annotation': ('parser', '_get_type_annotation'),
+        'process_fields': ('parser', '_process_fields'),
+        'process_function_def': ('parser', '_process_function_def'),
+        'determine_class_type': ('parser', '_determine_class_type'),
+        'process_global_vars': ('parser', '_process_global_vars'),
+        '_extract_documentation': ('parser', '_extract_documentation'),
+        'format_class_info': ('generator', '_format_class_info'),
+        'add_inheritance_relations': ('generator', '_add_inheritance_relations'),
+    }
+    
     def __init__(self, directory_path, use_gitignore=True):
         """
         Initialize UML generator with backward compatibility.
@@ -34,6 +55,21 @@ class UMLGenerator:
         self.uml = '@startuml\n'
         self.all_class_bases = {}
     
+    def __getattr__(self, name):
+        """
+        Resolve old method names to the bound methods of the new components.
+        
+        The bound method is stored on the instance, so later lookups of the
+        same name do not reach __getattr__ and calls need no wrapper frame.
+        """
+        try:
+            component, method_name = UMLGenerator._DELEGATED_METHODS[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+        method = getattr(getattr(self, component), method_name)
+        self.__dict__[name] = method
+        return method
+    
     def visibility(self, name):
         """
         Determine the visibility of a member based on its name.
@@ -81,80 +117,12 @@ class UMLGenerator:
         """Backward compatibility method."""
         return self.file_filter.should_ignore(file_path)
     
-    def _should_ignore_pathspec(self, file_path):
-        """Backward compatibility method."""
-        return self.file_filter._should_ignore_pathspec(file_path)
-    
-    def _should_ignore_simple(self, file_path):
-        """Backward compatibility method."""
-        return self.file_filter._should_ignore_simple(file_path)
-    
-    def _load_simple_gitignore_patterns(self, gitignore_file):
-        """Backward compatibility method."""
-        return self.file_filter._load_simple_gitignore_patterns(gitignore_file)
-    
-    def _match_simple_pattern(self, file_path, pattern):
-        """Backward compatibility method."""
-        return self.file_filter._match_simple_pattern(file_path, pattern)
-    
-    def _parse_file_partially(self, content, file_path):
-        """Backward compatibility method."""
-        return self.parser._parse_file_partially(content, file_path)
-    
     def _process_ast_node(self, node, classes, functions, global_vars, class_bases, file_path):
         """Backward compatibility method."""
         # This method is not directly available in the new parser
         # We'll implement a simplified version
         pass
     
-    def extract_fields_from_init(self, init_method):
-        """Backward compatibility method."""
-        return self.parser._extract_fields_from_init(init_method)
-    
-    def process_class_def(self, node):
-        """Backward compatibility method."""
-        return self.parser._process_class_def(node)
-    
-    def process_method_def(self, body_item):
-        """Backward compatibility method."""
-        return self.parser._process_method_def(body_item)
-    
-    def process_attributes(self, body_item):
-        """Backward compatibility method."""
-        return self.parser._process_attributes(body_item)
-    
-    def get_type_annotation(self, annotation):
-        """Backward compatibility method."""
-        return self.parser._get_type_annotation(annotation)
-    
-    def process_fields(self, body_item):
-        """Backward compatibility method."""
-        return self.parser._process_fields(body_item)
-    
-    def process_function_def(self, node):
-        """Backward compatibility method."""
-        return self.parser._process_function_def(node)
-    
-    def determine_class_type(self, has_fields, abstract_method_count, total_method_count, bases=None):
-        """Backward compatibility method."""
-        return self.parser._determine_class_type(has_fields, abstract_method_count, total_method_count, bases)
-    
-    def format_class_info(self, class_info):
-        """Backward compatibility method."""
-        return self.generator._format_class_info(class_info)
-    
-    def add_inheritance_relations(self):
-        """Backward compatibility method."""
-        return self.generator._add_inheritance_relations()
-    
-    def process_global_vars(self, node):
-        """Backward compatibility method."""
-        return self.parser._process_global_vars(node)
-    
-    def _extract_documentation(self, node):
-        """Backward compatibility method."""
-        return self.parser._extract_documentation(node)
-    
     def _get_file_summary(self, file_path, classes, functions, variables):
         """Backward compatibility method."""
         from py2puml.core.analyzer import FileAnalyzer
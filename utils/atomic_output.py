@@ -0,0 +1,82 @@
+"""
+Atomic output files for py2puml CLI.
+"""
+
+import errno
+import os
+import stat
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TextIO, Type, Union
+
+
+class AtomicOutputFile:
+    """
+    Text file written to a temporary sibling and moved over the target on success.
+
+    The target keeps its previous content until the with block completes
+    without an exception, so a failed run never leaves a partial file behind.
+    A symlinked target is resolved first, so the link keeps pointing at the
+    updated file, and an existing target that is not writable is refused.
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = 'utf-8', buffering: int = 1 << 20):
+        """
+        Create the temporary file next to the target.
+
+        Args:
+            path: Final path of the output file
+            encoding: Text encoding of the file
+            buffering: Buffer size in bytes, so writes reach the disk in large batches
+
+        Raises:
+            PermissionError: If the existing target is not writable
+            OSError: If the temporary file cannot be created
+        """
+        self.path = Path(os.path.realpath(path))
+        if os.path.exists(self.path) and not os.access(self.path, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(path))
+        fd, self.temp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=f'.{self.path.name}.', suffix='.tmp')
+        try:
+            self.file: TextIO = os.fdopen(fd, 'w', encoding=encoding, buffering=buffering)
+        except BaseException:
+            os.close(fd)
+            self._discard()
+            raise
+
+    def __enter__(self) -> TextIO:
+        return self.file
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        try:
+            self.file.close()
+            if exc_type is None:
+                os.chmod(self.temp_path, self._target_mode())
+                os.replace(self.temp_path, self.path)
+                return
+        except BaseException:
+            self._discard()
+            raise
+        self._discard()
+
+    def _target_mode(self) -> int:
+        """
+        Permissions for the final file: those of the replaced file, or the umask default.
+        """
+        try:
+            return stat.S_IMODE(os.stat(self.path).st_mode)
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _discard(self) -> None:
+        """
+        Remove the temporary file, ignoring errors.
+        """
+        try:
+            os.unlink(self.temp_path)
+        except OSError:
+            pass
@@ -2,14 +2,41 @@
 Error handling utilities for py2puml CLI.
 """
 
+import os
+import stat
 import sys
+import warnings
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Set
+
+# cli.py imports utils as a top-level package next to core
+try:
+    from ..core.deferred import DeferredMessage
+except ImportError:
+    from core.deferred import DeferredMessage  # type: ignore[import-not-found, no-redef]
+
+
+# Output formats accepted by the describe command
+_SUPPORTED_FORMATS = frozenset(('text', 'json', 'yaml'))
+_SUPPORTED_FORMATS_TEXT = 'text, json, yaml'
+
+# Output directories already known to exist in this process
+_KNOWN_DIRECTORIES: Set[str] = set()
 
 
 class CLIError(Exception):
     """Base exception for CLI errors."""
-    pass
+    
+    _rendered: Optional[str] = None
+    
+    @property
+    def rendered_message(self) -> str:
+        """
+        Error line printed by handle_cli_error, formatted on first use.
+        """
+        if self._rendered is None:
+            self._rendered = f"Error: {self}\n"
+        return self._rendered
 
 
 class ValidationError(CLIError):
@@ -17,7 +44,7 @@ class ValidationError(CLIError):
     pass
 
 
-class FileNotFoundError(CLIError):
+class FileNotFoundCLIError(CLIError):
     """Exception raised when file is not found."""
     pass
 
@@ -27,11 +54,39 @@ class DirectoryNotFoundError(CLIError):
     pass
 
 
-class PermissionError(CLIError):
+class PermissionCLIError(CLIError):
     """Exception raised for permission errors."""
     pass
 
 
+# Former public names, which shadowed the builtins of the same name
+_DEPRECATED_NAMES = {
+    'FileNotFoundError': FileNotFoundCLIError,
+    'PermissionError': PermissionCLIError,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the deprecated exception names with a DeprecationWarning.
+    
+    Args:
+        name: Attribute name missing from the module
+        
+    Returns:
+        The renamed exception class
+    """
+    replacement = _DEPRECATED_NAMES.get(name)
+    if replacement is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    warnings.warn(
+        f"{__name__}.{name} is deprecated, use {replacement.__name__} instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return replacement
+
+
 def validate_file_path(file_path: str) -> Path:
     """
     Validate file path and return Path object.
@@ -43,18 +98,24 @@ def validate_file_path(file_path: str) -> Path:
         Path object
         
     Raises:
-        FileNotFoundError: If file doesn't exist
-        ValidationError: If path is not a file
+        FileNotFoundCLIError: If file doesn't exist
+        PermissionCLIError: If file cannot be accessed due to permissions
+        ValidationError: If path is not a file or cannot be checked
     """
-    path = Path(file_path)
-    
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # One stat call answers both existence and type
+    try:
+        mode = os.stat(file_path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundCLIError(DeferredMessage("File not found: {}", file_path))
+    except PermissionError:
+        raise PermissionCLIError(DeferredMessage("Permission denied: {}", file_path))
+    except (OSError, ValueError) as e:
+        raise ValidationError(DeferredMessage("Cannot access {}: {}", file_path, e))
     
-    if not path.is_file():
-        raise ValidationError(f"Path is not a file: {file_path}")
+    if not stat.S_ISREG(mode):
+        raise ValidationError(DeferredMessage("Path is not a file: {}", file_path))
     
-    return path
+    return Path(file_path)
 
 
 def validate_directory_path(directory_path: str) -> Path:
@@ -69,17 +130,23 @@ def validate_directory_path(directory_path: str) -> Path:
         
     Raises:
         DirectoryNotFoundError: If directory doesn't exist
-        ValidationError: If path is not a directory
+        PermissionCLIError: If directory cannot be accessed due to permissions
+        ValidationError: If path is not a directory or cannot be checked
     """
-    path = Path(directory_path)
-    
-    if not path.exists():
-        raise DirectoryNotFoundError(f"Directory not found: {directory_path}")
+    # One stat call answers both existence and type
+    try:
+        mode = os.stat(directory_path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise DirectoryNotFoundError(DeferredMessage("Directory not found: {}", directory_path))
+    except PermissionError:
+        raise PermissionCLIError(DeferredMessage("Permission denied: {}", directory_path))
+    except (OSError, ValueError) as e:
+        raise ValidationError(DeferredMessage("Cannot access {}: {}", directory_path, e))
     
-    if not path.is_dir():
-        raise ValidationError(f"Path is not a directory: {directory_path}")
+    if not stat.S_ISDIR(mode):
+        raise ValidationError(DeferredMessage("Path is not a directory: {}", directory_path))
     
-    return path
+    return Path(directory_path)
 
 
 def validate_output_path(output_path: str) -> Path:
@@ -93,17 +160,41 @@ def validate_output_path(output_path: str) -> Path:
         Path object
         
     Raises:
-        PermissionError: If cannot create output directory
+        PermissionCLIError: If cannot create output directory
     """
-    path = Path(output_path)
-    output_dir = path.parent
+    # Work on the raw string; a Path is only built for the return value. The absolute
+    # directory keeps _KNOWN_DIRECTORIES valid when the working directory changes.
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    
+    # The output directory itself is always checked; remembered ancestors only stop
+    # the upward walk, so only the missing levels below them are created
+    missing = []
+    directory = output_dir
+    while not os.path.isdir(directory):
+        missing.append(directory)
+        parent = os.path.dirname(directory)
+        if not parent or parent == directory or parent in _KNOWN_DIRECTORIES:
+            break
+        directory = parent
+    else:
+        _KNOWN_DIRECTORIES.add(directory)
     
     try:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        for directory in reversed(missing):
+            try:
+                os.mkdir(directory)
+            except FileNotFoundError:
+                # A remembered ancestor was removed; create the whole chain
+                os.makedirs(directory, exist_ok=True)
+            except FileExistsError:
+                # Created concurrently, or an existing file in the way
+                if not os.path.isdir(directory):
+                    raise
+            _KNOWN_DIRECTORIES.add(directory)
     except Exception as e:
-        raise PermissionError(f"Cannot create output directory {output_dir}: {e}")
+        raise PermissionCLIError(DeferredMessage("Cannot create output directory {}: {}", output_dir, e))
     
-    return path
+    return Path(output_path)
 
 
 def validate_format(format_name: str) -> str:
@@ -119,10 +210,8 @@ def validate_format(format_name: str) -> str:
     Raises:
         ValidationError: If format is not supported
     """
-    supported_formats = ['text', 'json', 'yaml']
-    
-    if format_name not in supported_formats:
-        raise ValidationError(f"Unsupported format: {format_name}. Supported formats: {', '.join(supported_formats)}")
+    if format_name not in _SUPPORTED_FORMATS:
+        raise ValidationError(DeferredMessage("Unsupported format: {}. Supported formats: {}", format_name, _SUPPORTED_FORMATS_TEXT))
     
     return format_name
 
@@ -135,7 +224,16 @@ def handle_cli_error(error: Exception, exit_code: int = 1) -> None:
         error: Exception to handle
         exit_code: Exit code to use
     """
-    print(f"Error: {error}", file=sys.stderr)
+    message = error.rendered_message if isinstance(error, CLIError) else f"Error: {error}\n"
+    stream = sys.stderr
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        stream.write(message)
+    else:
+        # Pending text goes first, then the encoded message skips the text layer
+        stream.flush()
+        buffer.write(message.encode(stream.encoding or 'utf-8', 'backslashreplace'))
+        buffer.flush()
     sys.exit(exit_code)
 
 
@@ -147,6 +245,9 @@ def print_warnings(warnings: list) -> None:
         warnings: List of warning messages
     """
     if warnings:
-        print(f"\nWarning: {len(warnings)} warnings occurred during processing:", file=sys.stderr)
-        for warning in warnings:
-            print(f"  - {warning}", file=sys.stderr) 
\ No newline at end of file
+        # Build the whole report first so it reaches stderr in a single write
+        lines = [f"\nWarning: {len(warnings)} warnings occurred during processing:"]
+        lines.extend([f"  - {warning}" for warning in warnings])
+        lines.append('')
+        sys.stderr.write('\n'.join(lines))
+        sys.stderr.flush() 
\ No newline at end of file